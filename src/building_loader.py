@@ -6,18 +6,28 @@ Integrates with existing terrain workflow.
 """
 
 import logging
+import shutil
 import time
 import tempfile
+import traceback
 import zipfile
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import wraps
 
+import numpy as np
 import requests
+import shapely
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from shapely.geometry import shape, box, Polygon, MultiPolygon, Point
 from shapely.ops import unary_union
+from shapely.strtree import STRtree
+
+from src.loaders.tile_cache import cache_path_for
 
 try:
     import fiona
@@ -28,7 +38,7 @@ except ImportError:
     logging.warning("fiona not available - 3D building download disabled")
 
 try:
-    from pyproj import Transformer
+    from src.loaders.crs import get_transformer
     PYPROJ_AVAILABLE = True
 except ImportError:
     PYPROJ_AVAILABLE = False
@@ -38,6 +48,30 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _lv95_to_wgs84_approx(xs, ys):
+    """
+    Approximate EPSG:2056 -> WGS84 conversion for the no-pyproj fallback.
+
+    Accepts scalars or numpy arrays, so batch conversion of coordinate
+    arrays runs vectorized instead of once per point. Only suitable for
+    bbox-corner level accuracy, not precise reprojection.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    lon = (xs - 2600000.0) / 111320.0 + 7.44
+    lat = (ys - 1200000.0) / 111320.0 + 46.0
+    if lon.ndim == 0:
+        return float(lon), float(lat)
+    return lon, lat
+
+
+def _cached_boundary(egrid: str):
+    """Fetch the parcel boundary for an EGRID (memoized in the cadastre loader)."""
+    # Imported lazily to avoid circular dependency
+    from src.loaders.cadastre import fetch_boundary_by_egrid
+    return fetch_boundary_by_egrid(egrid)
+
+
 @dataclass
 class BuildingFeature:
     """Represents a building feature"""
@@ -48,6 +82,13 @@ class BuildingFeature:
     roof_type: Optional[str] = None
     year_built: Optional[int] = None
     attributes: Optional[Dict] = None
+    # Computed once at ingest; shapely re-runs the shoelace formula on
+    # every .area access, so downstream stats read this scalar instead
+    footprint_area_m2: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        if self.geometry is not None:
+            self.footprint_area_m2 = float(self.geometry.area)
 
 
 def rate_limit(max_per_second: float):
@@ -63,13 +104,13 @@ def rate_limit(max_per_second: float):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            elapsed = time.time() - last_called[0]
+            elapsed = time.perf_counter() - last_called[0]
             left_to_wait = min_interval - elapsed
             if left_to_wait > 0:
                 time.sleep(left_to_wait)
 
             result = func(*args, **kwargs)
-            last_called[0] = time.time()
+            last_called[0] = time.perf_counter()
             return result
 
         return wrapper
@@ -109,22 +150,42 @@ class SwissBuildingLoader:
         Initialize building loader
 
         Args:
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds (overridable via
+                BUILDING_LOADER_READ_TIMEOUT)
             retry_count: Number of retries for failed requests
-            use_cache: Whether to cache results (future feature)
+            use_cache: Whether to cache parcel query results in memory
         """
-        self.timeout = timeout
+        # Split connect/read timeouts so an unreachable endpoint fails in
+        # seconds instead of blocking for the full read timeout; both are
+        # env-tunable for CI environments without network access
+        self.timeout = (
+            float(os.environ.get("BUILDING_LOADER_CONNECT_TIMEOUT", "5")),
+            float(os.environ.get("BUILDING_LOADER_READ_TIMEOUT", str(timeout))),
+        )
         self.retry_count = retry_count
         self.use_cache = use_cache
+        self._search_area_cache: Dict[Tuple[str, float], Polygon] = {}
+        self._parcel_buildings_cache: Dict[Tuple[str, float], List[BuildingFeature]] = {}
+
+        # Session with connection pooling; retries with jittered backoff
+        # happen inside the adapter and honor server Retry-After hints
+        retry = Retry(
+            total=retry_count,
+            backoff_factor=0.5,
+            backoff_jitter=0.25,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+            respect_retry_after_header=True,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_maxsize=16)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
         # Initialize coordinate transformer if available
         if PYPROJ_AVAILABLE:
-            self.transformer_to_wgs84 = Transformer.from_crs(
-                "EPSG:2056", "EPSG:4326", always_xy=True
-            )
-            self.transformer_to_2056 = Transformer.from_crs(
-                "EPSG:4326", "EPSG:2056", always_xy=True
-            )
+            self.transformer_to_wgs84 = get_transformer("EPSG:2056", "EPSG:4326")
+            self.transformer_to_2056 = get_transformer("EPSG:4326", "EPSG:2056")
         else:
             self.transformer_to_wgs84 = None
             self.transformer_to_2056 = None
@@ -137,9 +198,7 @@ class SwissBuildingLoader:
             return self.transformer_to_wgs84.transform(x, y)
         else:
             # Rough approximation if pyproj not available
-            lon = (x - 2600000) / 111320 + 7.44
-            lat = (y - 1200000) / 111320 + 46.0
-            return lon, lat
+            return _lv95_to_wgs84_approx(x, y)
 
     def bbox_2056_to_wgs84(self, bbox: Tuple[float, float, float, float]) -> Tuple[float, float, float, float]:
         """Convert bbox from EPSG:2056 to WGS84"""
@@ -165,30 +224,14 @@ class SwissBuildingLoader:
         """
         if self.retry_count < 1:
             raise ValueError("retry_count must be at least 1")
-        
-        last_exception = None
-
-        for attempt in range(self.retry_count):
-            try:
-                if method.upper() == "GET":
-                    response = requests.get(url, params=params, timeout=self.timeout)
-                else:
-                    response = requests.post(url, params=params, timeout=self.timeout)
 
-                response.raise_for_status()
-                return response
-
-            except requests.RequestException as e:
-                last_exception = e
-                logger.warning(f"Request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
-
-                if attempt < self.retry_count - 1:
-                    # Exponential backoff
-                    time.sleep(2 ** attempt)
+        if method.upper() == "GET":
+            response = self._session.get(url, params=params, timeout=self.timeout)
+        else:
+            response = self._session.post(url, params=params, timeout=self.timeout)
 
-        if last_exception is None:
-            raise RuntimeError("Request failed but no exception was captured")
-        raise last_exception
+        response.raise_for_status()
+        return response
 
     def get_buildings_wfs(
         self,
@@ -227,6 +270,12 @@ class SwissBuildingLoader:
             params["CQL_FILTER"] = cql_filter
 
         try:
+            # Cheap preflight: WFS is disabled on Swiss servers, so
+            # confirm the endpoint responds before paying the full
+            # GetFeature read timeout
+            preflight = self._session.head(self.WFS_URL, timeout=2)
+            preflight.raise_for_status()
+
             response = self._request_with_retry(self.WFS_URL, params)
             data = response.json()
 
@@ -371,93 +420,160 @@ class SwissBuildingLoader:
             return []
         
         logger.info(f"Found {len(tiles)} tiles, processing up to {max_tiles} tiles...")
-        
+
         all_buildings = []
-        
-        # Step 2: Download and parse each tile
-        for tile_idx, tile in enumerate(tiles):
-            try:
-                # Find GDB asset
-                gdb_asset = None
-                for asset_name, asset_info in tile.get("assets", {}).items():
-                    if "gdb.zip" in asset_name.lower():
-                        gdb_asset = asset_info
-                        break
-                
-                if not gdb_asset:
-                    logger.warning(f"No GDB asset found in tile {tile.get('id')}")
-                    continue
-                
-                gdb_url = gdb_asset.get("href")
-                if not gdb_url:
+
+        # Step 2: Download tiles (concurrently when there are several),
+        # then parse serially - downloads are network-bound and
+        # independent, while fiona handles should stay on one thread
+        with tempfile.TemporaryDirectory(prefix="gdb_tiles_") as temp_root:
+            gdb_paths: Dict[int, Optional[str]] = {}
+
+            if len(tiles) > 1:
+                with ThreadPoolExecutor(max_workers=min(4, len(tiles))) as executor:
+                    futures = {
+                        executor.submit(
+                            self._download_gdb_tile, tile, temp_root, timeout
+                        ): idx
+                        for idx, tile in enumerate(tiles)
+                    }
+                    for future in as_completed(futures):
+                        idx = futures[future]
+                        try:
+                            gdb_paths[idx] = future.result()
+                        except Exception as e:
+                            logger.error(f"Failed to download tile {tiles[idx].get('id')}: {e}")
+                            logger.debug(traceback.format_exc())
+            else:
+                for idx, tile in enumerate(tiles):
+                    try:
+                        gdb_paths[idx] = self._download_gdb_tile(tile, temp_root, timeout)
+                    except Exception as e:
+                        logger.error(f"Failed to download tile {tile.get('id')}: {e}")
+                        logger.debug(traceback.format_exc())
+
+            for tile_idx, tile in enumerate(tiles):
+                gdb_path = gdb_paths.get(tile_idx)
+                if not gdb_path:
                     continue
-                
-                logger.info(f"Processing tile {tile_idx + 1}/{len(tiles)}: {tile.get('id')}")
-                logger.info(f"Downloading GDB from {gdb_url[:80]}...")
-                download_start = time.time()
-                
-                # Extract to temp directory (auto-cleans up on exit)
-                with tempfile.TemporaryDirectory(prefix="gdb_tile_") as temp_dir:
-                    zip_path = os.path.join(temp_dir, "tile.gdb.zip")
-                    
-                    # Download with streaming to avoid memory issues
-                    response = requests.get(gdb_url, timeout=timeout, stream=True)
-                    response.raise_for_status()
-                    
-                    # Get content length for progress
-                    total_size = int(response.headers.get('content-length', 0))
-                    
-                    # Write downloaded content to file
-                    downloaded_size = 0
-                    with open(zip_path, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:  # filter out keep-alive chunks
-                                f.write(chunk)
-                                downloaded_size += len(chunk)
-                    
-                    download_time = time.time() - download_start
-                    size_mb = downloaded_size / 1024 / 1024
-                    logger.info(f"Downloaded {size_mb:.1f} MB in {download_time:.1f}s")
-                    
-                    # Extract zip
-                    extract_start = time.time()
-                    extract_dir = os.path.join(temp_dir, "gdb")
-                    os.makedirs(extract_dir, exist_ok=True)
-                    
-                    with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                        zip_ref.extractall(extract_dir)
-                    
-                    extract_time = time.time() - extract_start
-                    logger.info(f"Extracted in {extract_time:.1f}s")
-                    
-                    # Find GDB directory
-                    gdb_dirs = [d for d in os.listdir(extract_dir) if d.endswith(".gdb")]
-                    if not gdb_dirs:
-                        logger.warning(f"No .gdb directory found in extracted files")
-                        continue
-                    
-                    gdb_path = os.path.join(extract_dir, gdb_dirs[0])
-                    
-                    # Parse with Fiona
-                    parse_start = time.time()
+                try:
+                    logger.info(f"Processing tile {tile_idx + 1}/{len(tiles)}: {tile.get('id')}")
+                    parse_start = time.perf_counter()
                     buildings = self._parse_gdb_tile(gdb_path, bbox_2056)
-                    parse_time = time.time() - parse_start
-                    
+                    parse_time = time.perf_counter() - parse_start
+
                     logger.info(f"Parsed {len(buildings)} buildings from tile in {parse_time:.1f}s")
                     all_buildings.extend(buildings)
-                    
-                    # Temp directory automatically cleaned up here when exiting 'with' block
-                    logger.debug(f"Cleaned up temp files for tile {tile.get('id')}")
-            
-            except Exception as e:
-                logger.error(f"Failed to process tile {tile.get('id')}: {e}")
-                import traceback
-                logger.debug(traceback.format_exc())
-                continue
-        
+                except Exception as e:
+                    logger.error(f"Failed to process tile {tile.get('id')}: {e}")
+                    logger.debug(traceback.format_exc())
+                    continue
+
+            # Temp directories cleaned up here when exiting 'with' block
+
         logger.info(f"Retrieved {len(all_buildings)} 3D buildings total")
         return all_buildings
 
+    def _download_gdb_tile(
+        self,
+        tile: Dict,
+        temp_root: str,
+        timeout: int
+    ) -> Optional[str]:
+        """
+        Download and extract one GDB tile zip
+
+        Args:
+            tile: STAC tile feature
+            temp_root: Directory to extract into (caller owns cleanup)
+            timeout: Download timeout in seconds
+
+        Returns:
+            Path to the extracted .gdb directory, or None if unavailable
+        """
+        # Find GDB asset
+        gdb_asset = None
+        for asset_name, asset_info in tile.get("assets", {}).items():
+            if "gdb.zip" in asset_name.lower():
+                gdb_asset = asset_info
+                break
+
+        if not gdb_asset:
+            logger.warning(f"No GDB asset found in tile {tile.get('id')}")
+            return None
+
+        gdb_url = gdb_asset.get("href")
+        if not gdb_url:
+            return None
+
+        tile_dir = tempfile.mkdtemp(prefix="gdb_tile_", dir=temp_root)
+        zip_path = os.path.join(tile_dir, "tile.gdb.zip")
+
+        # Tile URLs are versioned, so a cached archive is always valid
+        cache_file = cache_path_for(gdb_url)
+        if cache_file is not None and cache_file.exists():
+            logger.info(f"Using cached GDB archive for {gdb_url[:80]}")
+            zip_path = str(cache_file)
+        else:
+            logger.info(f"Downloading GDB from {gdb_url[:80]}...")
+            download_start = time.perf_counter()
+
+            # Download with streaming to avoid memory issues, through the
+            # pooled session so concurrent tiles reuse connections
+            response = self._session.get(gdb_url, timeout=timeout, stream=True)
+            response.raise_for_status()
+
+            # Write downloaded content to file
+            downloaded_size = 0
+            with open(zip_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    if chunk:  # filter out keep-alive chunks
+                        f.write(chunk)
+                        downloaded_size += len(chunk)
+
+            download_time = time.perf_counter() - download_start
+            size_mb = downloaded_size / 1024 / 1024
+            logger.info(f"Downloaded {size_mb:.1f} MB in {download_time:.1f}s")
+
+            if cache_file is not None:
+                # Atomic publish via a unique temp name so concurrent runs
+                # sharing the cache directory never interleave writes
+                fd, tmp_file = tempfile.mkstemp(dir=cache_file.parent, suffix=".part")
+                os.close(fd)
+                try:
+                    shutil.copyfile(zip_path, tmp_file)
+                    os.replace(tmp_file, cache_file)
+                except BaseException:
+                    try:
+                        os.remove(tmp_file)
+                    except OSError:
+                        pass
+                    raise
+
+        # Extract zip
+        extract_start = time.perf_counter()
+        extract_dir = os.path.join(tile_dir, "gdb")
+        os.makedirs(extract_dir, exist_ok=True)
+
+        with zipfile.ZipFile(zip_path, "r") as zip_ref:
+            zip_ref.extractall(extract_dir)
+
+        # The zip is no longer needed once extracted (unless it lives in
+        # the persistent cache)
+        if cache_file is None or zip_path != str(cache_file):
+            os.remove(zip_path)
+
+        extract_time = time.perf_counter() - extract_start
+        logger.info(f"Extracted in {extract_time:.1f}s")
+
+        # Find GDB directory
+        gdb_dirs = [d for d in os.listdir(extract_dir) if d.endswith(".gdb")]
+        if not gdb_dirs:
+            logger.warning(f"No .gdb directory found in extracted files")
+            return None
+
+        return os.path.join(extract_dir, gdb_dirs[0])
+
     def _parse_gdb_tile(
         self,
         gdb_path: str,
@@ -501,11 +617,12 @@ class SwissBuildingLoader:
             # Create bbox polygon for filtering
             bbox_poly = box(bbox_2056[0], bbox_2056[1], bbox_2056[2], bbox_2056[3])
             
-            # Read features
+            # Read features with a spatial filter so features far outside
+            # the bbox are culled inside GDAL before they reach Python
             with fiona.open(gdb_path, layer=building_layer) as src:
                 logger.info(f"CRS: {src.crs}")
-                
-                for feature in src:
+
+                for feature in src.filter(bbox=bbox_2056):
                     try:
                         # Get geometry
                         geom = shape(feature["geometry"])
@@ -668,9 +785,9 @@ class SwissBuildingLoader:
                 largest = max(geom.geoms, key=lambda p: p.area)
                 geom = largest
 
-            # Extract to 2D if 3D
-            if geom.has_z:
-                geom = Polygon([(x, y) for x, y, *_ in geom.exterior.coords])
+            # Extract to 2D if 3D (force_2d runs in GEOS and keeps interior rings)
+            if shapely.has_z(geom):
+                geom = shapely.force_2d(geom)
 
             # Extract properties
             attrs = result.get("attributes", {})
@@ -715,12 +832,16 @@ class SwissBuildingLoader:
         if method == "rest":
             buildings = self.get_buildings_rest(bbox)
 
-            # Filter to circular area
-            center = shape({"type": "Point", "coordinates": [x, y]})
-            filtered = [
-                b for b in buildings
-                if b.geometry.distance(center) <= radius
-            ]
+            # Filter to circular area; dwithin runs the distance checks
+            # in GEOS over the tree instead of a per-building Python loop
+            if buildings:
+                tree = STRtree([b.geometry for b in buildings])
+                hits = tree.query(
+                    Point(x, y), predicate="dwithin", distance=radius
+                )
+                filtered = [buildings[i] for i in sorted(hits)]
+            else:
+                filtered = []
 
             logger.info(f"Filtered {len(filtered)}/{len(buildings)} buildings within {radius}m radius")
             return filtered
@@ -755,13 +876,21 @@ class SwissBuildingLoader:
         Returns:
             List of BuildingFeature objects
         """
-        logger.info(f"Fetching buildings for EGRID: {egrid}")
+        # Repeat queries for the same parcel (e.g. stats after load) skip
+        # the full WFS/REST round-trip entirely
+        cache_key = (egrid, buffer_m)
+        if self.use_cache and cache_key in self._parcel_buildings_cache:
+            cached = self._parcel_buildings_cache[cache_key]
+            logger.info(
+                f"Using cached buildings for EGRID {egrid} "
+                f"({len(cached)} features, buffer: {buffer_m}m)"
+            )
+            return list(cached)
 
-        # Import here to avoid circular dependency
-        from src.terrain_with_site import fetch_boundary_by_egrid
+        logger.info(f"Fetching buildings for EGRID: {egrid}")
 
-        # Get parcel boundary using existing function
-        site_boundary, metadata = fetch_boundary_by_egrid(egrid)
+        # Get parcel boundary using existing function (memoized per EGRID)
+        site_boundary, metadata = _cached_boundary(egrid)
         if site_boundary is None:
             logger.warning(f"No boundary found for EGRID {egrid}")
             return []
@@ -778,22 +907,35 @@ class SwissBuildingLoader:
         # Get buildings in bbox using REST API (WFS is disabled)
         buildings = self.get_buildings_rest(bbox)
 
-        # Filter to buildings that intersect the parcel (with buffer)
-        if buffer_m > 0:
-            search_area = site_boundary.buffer(buffer_m)
+        # Filter to buildings that intersect the parcel (with buffer).
+        # Buffering is not free, so reuse the buffered area across repeat
+        # queries for the same parcel.
+        search_area = self._search_area_cache.get(cache_key)
+        if search_area is None:
+            if buffer_m > 0:
+                search_area = site_boundary.buffer(buffer_m)
+            else:
+                search_area = site_boundary
+            self._search_area_cache[cache_key] = search_area
+
+        # An STRtree over the building MBRs prunes most candidates before
+        # the exact test; passing the predicate to query() keeps the
+        # exact intersection checks in GEOS instead of a Python loop
+        if buildings:
+            tree = STRtree([b.geometry for b in buildings])
+            hits = tree.query(search_area, predicate="intersects")
+            filtered_buildings = [buildings[i] for i in sorted(hits)]
         else:
-            search_area = site_boundary
-
-        filtered_buildings = [
-            b for b in buildings
-            if search_area.intersects(b.geometry)
-        ]
+            filtered_buildings = []
 
         logger.info(
             f"Found {len(filtered_buildings)} buildings on parcel "
             f"(buffer: {buffer_m}m)"
         )
 
+        if self.use_cache:
+            self._parcel_buildings_cache[cache_key] = list(filtered_buildings)
+
         return filtered_buildings
 
     def _parse_building_feature(self, feature: Dict) -> Optional[BuildingFeature]:
@@ -810,9 +952,9 @@ class SwissBuildingLoader:
             # Parse geometry
             geom = shape(feature["geometry"])
 
-            # Extract to 2D if 3D
-            if geom.has_z:
-                geom = Polygon([(x, y) for x, y, *_ in geom.exterior.coords])
+            # Extract to 2D if 3D (force_2d runs in GEOS and keeps interior rings)
+            if shapely.has_z(geom):
+                geom = shapely.force_2d(geom)
 
             # Extract properties
             props = feature.get("properties", {})
@@ -848,16 +990,40 @@ class SwissBuildingLoader:
         Returns:
             List of BuildingFeature objects
         """
-        # Build CQL filter
-        filters = []
-        if min_height is not None:
-            filters.append(f"hoehe_max >= {min_height}")
-        if max_height is not None:
-            filters.append(f"hoehe_max <= {max_height}")
+        # WFS (and its CQL filters) is disabled on Swiss servers; routing
+        # through it guaranteed a full request timeout before failing.
+        # Fetch via REST and filter the parsed heights locally instead.
+        buildings = self.get_buildings_rest(bbox_2056)
+
+        filtered = [
+            b for b in buildings
+            if b.height is not None
+            and (min_height is None or b.height >= min_height)
+            and (max_height is None or b.height <= max_height)
+        ]
+
+        logger.info(
+            f"Filtered {len(filtered)}/{len(buildings)} buildings by height "
+            f"(min: {min_height}, max: {max_height})"
+        )
+        return filtered
+
+    def total_footprint(self, buildings: List[BuildingFeature]):
+        """
+        Union of all building footprints with overlaps merged
+
+        Uses GEOS' cascaded union (log-depth pairwise merges), which stays
+        fast even for thousands of polygons.
 
-        cql_filter = " AND ".join(filters) if filters else None
+        Args:
+            buildings: List of BuildingFeature objects
 
-        return self.get_buildings_wfs(bbox_2056, cql_filter=cql_filter)
+        Returns:
+            Shapely (Multi)Polygon covering the merged footprints
+        """
+        if not buildings:
+            return MultiPolygon([])
+        return unary_union([b.geometry for b in buildings])
 
     def get_building_statistics(
         self,
@@ -881,17 +1047,30 @@ class SwissBuildingLoader:
                 "min_height_m": 0
             }
 
-        heights = [b.height for b in buildings if b.height is not None]
-        footprint_areas = [b.geometry.area for b in buildings]
+        # Aggregate in NumPy so the reductions run in C instead of
+        # per-building Python loops
+        areas = np.fromiter(
+            (b.footprint_area_m2 for b in buildings),
+            dtype=np.float64,
+            count=len(buildings),
+        )
+        heights = np.array(
+            [b.height for b in buildings if b.height is not None],
+            dtype=np.float64,
+        )
+        height_count = heights.size
 
         return {
             "count": len(buildings),
-            "total_footprint_area_m2": sum(footprint_areas),
-            "avg_footprint_area_m2": sum(footprint_areas) / len(footprint_areas),
-            "avg_height_m": sum(heights) / len(heights) if heights else 0,
-            "max_height_m": max(heights) if heights else 0,
-            "min_height_m": min(heights) if heights else 0,
-            "buildings_with_height": len(heights)
+            "total_footprint_area_m2": float(areas.sum()),
+            # total_footprint_area_m2 double-counts overlapping polygons;
+            # the unioned area does not
+            "unique_footprint_area_m2": self.total_footprint(buildings).area,
+            "avg_footprint_area_m2": float(areas.mean()),
+            "avg_height_m": float(heights.mean()) if height_count else 0,
+            "max_height_m": float(heights.max()) if height_count else 0,
+            "min_height_m": float(heights.min()) if height_count else 0,
+            "buildings_with_height": int(height_count)
         }
 
 
@@ -10,7 +10,8 @@ from typing import List, Tuple, Optional
 
 import ifcopenshell
 import ifcopenshell.api
-from shapely.geometry import Polygon, MultiPolygon
+import numpy as np
+from shapely.geometry import Polygon, MultiPolygon, shape
 from shapely.ops import orient, triangulate
 
 from src.building_loader import BuildingFeature
@@ -174,8 +175,6 @@ def _create_brep_from_3d_geometry(
     - Bottom face at base elevation
     """
     try:
-        from shapely.geometry import shape, Polygon as ShapelyPolygon
-        
         # geom_3d should be a GeoJSON-like dict or Shapely geometry
         if isinstance(geom_3d, dict):
             geom = shape(geom_3d)
@@ -207,9 +206,9 @@ def _create_brep_from_3d_geometry(
             
             if has_z:
                 # Extract Z values for min/max
-                z_values = [z for x, y, z in coords_3d]
-                min_z = min(min_z, min(z_values))
-                max_z = max(max_z, max(z_values))
+                z_values = np.asarray(coords_3d, dtype=np.float64)[:, 2]
+                min_z = min(min_z, float(z_values.min()))
+                max_z = max(max_z, float(z_values.max()))
                 
                 # Create roof face with Z coordinates
                 points = [
@@ -671,7 +670,9 @@ def building_to_ifc(
     offset_y: float = 0.0,
     offset_z: float = 0.0,
     base_elevation: float = 0.0,
-    default_height: float = DEFAULT_BUILDING_HEIGHT
+    default_height: float = DEFAULT_BUILDING_HEIGHT,
+    assign_to_site: bool = True,
+    axis_placement: Optional[ifcopenshell.entity_instance] = None
 ) -> Optional[ifcopenshell.entity_instance]:
     """
     Convert a BuildingFeature to an IfcBuilding element with visible geometry
@@ -685,6 +686,10 @@ def building_to_ifc(
         offset_x, offset_y, offset_z: Project origin offsets
         base_elevation: Base elevation for building (ground level)
         default_height: Default building height if not provided (meters)
+        assign_to_site: Aggregate the building under the site here; batch
+            callers set False and assign all buildings in one call
+        axis_placement: Shared identity IfcAxis2Placement3D to reuse
+            instead of creating one per building
 
     Returns:
         IfcBuilding element or None if failed
@@ -722,24 +727,27 @@ def building_to_ifc(
     if building.building_class:
         ifc_building.Description = str(building.building_class)
 
-    # Create placement relative to site
-    origin = model.createIfcCartesianPoint([0.0, 0.0, 0.0])
-    axis = model.createIfcDirection([0.0, 0.0, 1.0])
-    ref_direction = model.createIfcDirection([1.0, 0.0, 0.0])
-    axis2_placement = model.createIfcAxis2Placement3D(origin, axis, ref_direction)
+    # Create placement relative to site; the identity axis placement is
+    # the same for every building, so reuse a shared one when provided
+    if axis_placement is None:
+        origin = model.createIfcCartesianPoint([0.0, 0.0, 0.0])
+        axis = model.createIfcDirection([0.0, 0.0, 1.0])
+        ref_direction = model.createIfcDirection([1.0, 0.0, 0.0])
+        axis_placement = model.createIfcAxis2Placement3D(origin, axis, ref_direction)
     building_placement = model.createIfcLocalPlacement(
         site.ObjectPlacement,
-        axis2_placement
+        axis_placement
     )
     ifc_building.ObjectPlacement = building_placement
 
     # Assign building to site
-    ifcopenshell.api.run(
-        "aggregate.assign_object",
-        model,
-        products=[ifc_building],
-        relating_object=site
-    )
+    if assign_to_site:
+        ifcopenshell.api.run(
+            "aggregate.assign_object",
+            model,
+            products=[ifc_building],
+            relating_object=site
+        )
 
     # Create representations
     representations = []
@@ -828,17 +836,34 @@ def buildings_to_ifc(
 
     logger.info(f"Converting {len(buildings)} buildings to IFC...")
 
+    # One identity axis placement shared by all buildings, and one
+    # aggregate.assign_object call at the end - the per-building call
+    # re-traverses the model's decomposition each time
+    origin = model.createIfcCartesianPoint([0.0, 0.0, 0.0])
+    axis = model.createIfcDirection([0.0, 0.0, 1.0])
+    ref_direction = model.createIfcDirection([1.0, 0.0, 0.0])
+    axis_placement = model.createIfcAxis2Placement3D(origin, axis, ref_direction)
+
     for building in buildings:
         try:
             ifc_building = building_to_ifc(
                 model, building, site, body_context, footprint_context,
-                offset_x, offset_y, offset_z, base_elevation, default_height
+                offset_x, offset_y, offset_z, base_elevation, default_height,
+                assign_to_site=False, axis_placement=axis_placement
             )
             if ifc_building:
                 ifc_buildings.append(ifc_building)
         except Exception as e:
             logger.error(f"Failed to convert building {building.id}: {e}")
 
+    if ifc_buildings:
+        ifcopenshell.api.run(
+            "aggregate.assign_object",
+            model,
+            products=ifc_buildings,
+            relating_object=site
+        )
+
     logger.info(f"Successfully converted {len(ifc_buildings)}/{len(buildings)} buildings")
 
     return ifc_buildings
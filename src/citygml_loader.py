@@ -6,9 +6,11 @@ Provides lod2Solid geometry with walls, roofs, and ground surfaces.
 """
 
 import logging
+import shutil
 import tempfile
 import zipfile
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
@@ -22,9 +24,11 @@ except ImportError:
     XML_SAFE = False
     logging.warning("defusedxml not available - using standard XML parser (less secure)")
 
+import numpy as np
 import requests
 from shapely.geometry import Polygon, box, Point
-from pyproj import Transformer
+from src.loaders.crs import get_transformer
+from src.loaders.tile_cache import cache_path_for
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +65,16 @@ class CityGMLBuildingLoader:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
-        self.transformer = Transformer.from_crs("EPSG:2056", "EPSG:4326", always_xy=True)
+        self.transformer = get_transformer("EPSG:2056", "EPSG:4326")
+        # Pooled session so STAC queries and concurrent tile downloads
+        # reuse connections instead of paying DNS+TLS per request
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Parsed tiles keyed by (asset URL, bbox) so repeat queries in a
+        # session skip the download and XML parse entirely
+        self._tile_cache: Dict[Tuple[str, Tuple], List[CityGMLBuilding]] = {}
     
     def get_buildings_in_bbox(
         self,
@@ -89,7 +102,7 @@ class CityGMLBuildingLoader:
         url = f"{self.STAC_BASE}/collections/{self.COLLECTION}/items"
         params = {'bbox': ','.join(map(str, bbox_wgs84)), 'limit': max_tiles}
         
-        response = requests.get(url, params=params, timeout=self.timeout)
+        response = self._session.get(url, params=params, timeout=self.timeout)
         response.raise_for_status()
         
         tiles = response.json().get('features', [])
@@ -98,18 +111,35 @@ class CityGMLBuildingLoader:
             return []
         
         logger.info(f"Found {len(tiles)} tiles, processing up to {max_tiles}...")
-        
+
+        tiles_to_process = tiles[:max_tiles]
         all_buildings = []
-        
-        for tile_idx, tile in enumerate(tiles[:max_tiles]):
-            try:
-                buildings = self._process_tile(tile, bbox_2056)
-                all_buildings.extend(buildings)
-                logger.info(f"Processed tile {tile_idx + 1}/{len(tiles[:max_tiles])}: {len(buildings)} buildings")
-            except Exception as e:
-                logger.error(f"Failed to process tile {tile.get('id')}: {e}")
-                continue
-        
+
+        if len(tiles_to_process) > 1:
+            # Tile processing is dominated by the zip download, so fetch
+            # tiles concurrently instead of one round-trip after another
+            with ThreadPoolExecutor(max_workers=min(4, len(tiles_to_process))) as executor:
+                futures = {
+                    executor.submit(self._process_tile, tile, bbox_2056): tile
+                    for tile in tiles_to_process
+                }
+                for tile_idx, future in enumerate(as_completed(futures)):
+                    tile = futures[future]
+                    try:
+                        buildings = future.result()
+                        all_buildings.extend(buildings)
+                        logger.info(f"Processed tile {tile_idx + 1}/{len(tiles_to_process)}: {len(buildings)} buildings")
+                    except Exception as e:
+                        logger.error(f"Failed to process tile {tile.get('id')}: {e}")
+        else:
+            for tile in tiles_to_process:
+                try:
+                    buildings = self._process_tile(tile, bbox_2056)
+                    all_buildings.extend(buildings)
+                    logger.info(f"Processed tile 1/1: {len(buildings)} buildings")
+                except Exception as e:
+                    logger.error(f"Failed to process tile {tile.get('id')}: {e}")
+
         logger.info(f"Retrieved {len(all_buildings)} buildings from CityGML")
         return all_buildings
     
@@ -137,19 +167,46 @@ class CityGMLBuildingLoader:
         
         if not citygml_url:
             raise ValueError(f"No CityGML asset found in tile {tile.get('id')}")
-        
+
+        cache_key = (citygml_url, bbox_2056)
+        cached = self._tile_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using in-memory tile result for {tile.get('id')}")
+            return cached
+
         # Download and extract
         with tempfile.TemporaryDirectory() as tmpdir:
             zip_path = os.path.join(tmpdir, 'buildings.zip')
-            
-            response = requests.get(citygml_url, timeout=self.timeout, stream=True)
-            response.raise_for_status()
-            
-            with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-            
+
+            # Tile URLs are versioned, so a cached archive is always valid
+            cache_file = cache_path_for(citygml_url)
+            if cache_file is not None and cache_file.exists():
+                logger.info(f"Using cached CityGML archive for {citygml_url[:80]}")
+                zip_path = str(cache_file)
+            else:
+                response = self._session.get(citygml_url, timeout=self.timeout, stream=True)
+                response.raise_for_status()
+
+                with open(zip_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        if chunk:
+                            f.write(chunk)
+
+                if cache_file is not None:
+                    # Atomic publish via a unique temp name so concurrent runs
+                    # sharing the cache directory never interleave writes
+                    fd, tmp_file = tempfile.mkstemp(dir=cache_file.parent, suffix='.part')
+                    os.close(fd)
+                    try:
+                        shutil.copyfile(zip_path, tmp_file)
+                        os.replace(tmp_file, cache_file)
+                    except BaseException:
+                        try:
+                            os.remove(tmp_file)
+                        except OSError:
+                            pass
+                        raise
+
             # Safe extraction with path validation to prevent zip slip attacks
             with zipfile.ZipFile(zip_path, 'r') as zf:
                 tmpdir_path = Path(tmpdir).resolve()
@@ -188,7 +245,9 @@ class CityGMLBuildingLoader:
                 raise ValueError("No GML file found in extracted archive")
             
             # Parse CityGML
-            return self._parse_citygml(gml_file, bbox_2056)
+            buildings = self._parse_citygml(gml_file, bbox_2056)
+            self._tile_cache[cache_key] = buildings
+            return buildings
     
     def _parse_citygml(
         self,
@@ -268,12 +327,11 @@ class CityGMLBuildingLoader:
                     continue
                 
                 coords_text = poslist.text.strip()
-                coords_list = [float(x) for x in coords_text.split()]
-                
-                # Group into XYZ triples
-                points = [(coords_list[i], coords_list[i+1], coords_list[i+2]) 
-                         for i in range(0, len(coords_list), 3)]
-                
+                # Let numpy convert the whole posList in C and reshape
+                # into XYZ triples instead of a per-token float() loop
+                coords_arr = np.array(coords_text.split(), dtype=np.float64)
+                points = [tuple(p) for p in coords_arr.reshape(-1, 3).tolist()]
+
                 if len(points) >= 3:
                     faces_data.append(points)
                     all_points.extend(points)
@@ -281,28 +339,27 @@ class CityGMLBuildingLoader:
             if not faces_data:
                 continue
             
-            # Calculate bounding box and centroid
-            xs = [p[0] for p in all_points]
-            ys = [p[1] for p in all_points]
-            zs = [p[2] for p in all_points]
-            
-            centroid_x = sum(xs) / len(xs)
-            centroid_y = sum(ys) / len(ys)
-            
+            # Calculate bounding box and centroid with vectorized
+            # reductions instead of six Python passes over the vertices
+            points_arr = np.asarray(all_points, dtype=np.float64)
+            mins = points_arr.min(axis=0)
+            maxs = points_arr.max(axis=0)
+            centroid_x, centroid_y = points_arr[:, :2].mean(axis=0)
+
             # Check if building intersects target area
-            building_bbox = box(min(xs), min(ys), max(xs), max(ys))
+            building_bbox = box(mins[0], mins[1], maxs[0], maxs[1])
             if not target_box.intersects(building_bbox):
                 continue
-            
+
             buildings.append(CityGMLBuilding(
                 id=bldg_id,
                 faces=faces_data,
                 height_max=height_max,
                 height_min=height_min,
                 building_type=building_type,
-                centroid=(centroid_x, centroid_y),
-                z_min=min(zs),
-                z_max=max(zs),
+                centroid=(float(centroid_x), float(centroid_y)),
+                z_min=float(mins[2]),
+                z_max=float(maxs[2]),
                 attributes=attrs
             ))
         
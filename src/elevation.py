@@ -13,6 +13,11 @@ from typing import List, Tuple, Optional
 _session = None
 _session_lock = threading.Lock()
 
+# Memoized successful lookups, shared across batches. Adjacent features
+# sample many of the same points (shared boundaries, overlapping grids),
+# so repeated runs within a process skip the REST round-trip entirely.
+_elevation_cache = {}
+
 def _get_session():
     global _session
     if _session is None:
@@ -67,35 +72,49 @@ def fetch_elevation_batch(coords: List[Tuple[float, float]], batch_size: int = 1
     total = len(coords)
     elevations = [None] * total
     failed_count = 0
-    
-    print(f"Fetching elevations for {total} points (concurrent, {max_workers} workers)...")
-    
-    # Use ThreadPoolExecutor for concurrent requests
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_index = {
-            executor.submit(_fetch_single_elevation, coord): i 
-            for i, coord in enumerate(coords)
-        }
-        
-        completed = 0
-        for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            try:
-                elevation = future.result()
+
+    # Resolve cached points up front and collapse duplicates so each
+    # unique coordinate is requested at most once.
+    pending = {}  # (x, y) -> list of result indices
+    for i, coord in enumerate(coords):
+        key = (float(coord[0]), float(coord[1]))
+        if key in _elevation_cache:
+            elevations[i] = _elevation_cache[key]
+        else:
+            pending.setdefault(key, []).append(i)
+
+    n_unique = len(pending)
+    print(f"Fetching elevations for {total} points "
+          f"({n_unique} unique to fetch, concurrent, {max_workers} workers)...")
+
+    if pending:
+        # Use ThreadPoolExecutor for concurrent requests
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Submit one task per unique coordinate
+            future_to_key = {
+                executor.submit(_fetch_single_elevation, key): key
+                for key in pending
+            }
+
+            completed = 0
+            for future in as_completed(future_to_key):
+                key = future_to_key[future]
+                try:
+                    elevation = future.result()
+                except Exception:
+                    elevation = None
+
                 if elevation is not None:
-                    elevations[index] = elevation
+                    _elevation_cache[key] = elevation
                 else:
-                    failed_count += 1
-                    elevations[index] = None
-            except Exception:
-                failed_count += 1
-                elevations[index] = None
-            
-            completed += 1
-            if completed % batch_size == 0:
-                pct = completed / total * 100
-                print(f"  Progress: {completed}/{total} ({pct:.1f}%)")
+                    failed_count += len(pending[key])
+                for index in pending[key]:
+                    elevations[index] = elevation
+
+                completed += 1
+                if completed % batch_size == 0:
+                    pct = completed / n_unique * 100
+                    print(f"  Progress: {completed}/{n_unique} ({pct:.1f}%)")
     
     # Post-processing: replace None values with average of successful elevations
     successful_elevations = [e for e in elevations if e is not None]
@@ -50,51 +50,31 @@ def create_terrain_mesh_with_uvs(
         logger.warning("Invalid imagery bounding box, cannot create UV coordinates")
         return None
     
-    # Collect all vertices and faces
-    vertices = []
-    faces = []
-    uv_coords = []
-    
-    vertex_map = {}  # Map (x, y, z) -> vertex index
-    
-    for tri in triangles:
-        face_indices = []
-        for pt in tri:
-            # Convert to local coordinates
-            local_pt = (pt[0] - offset_x, pt[1] - offset_y, pt[2] - offset_z)
-            
-            # Check if vertex already exists
-            pt_key = (round(local_pt[0], 6), round(local_pt[1], 6), round(local_pt[2], 6))
-            
-            if pt_key not in vertex_map:
-                vertex_map[pt_key] = len(vertices)
-                vertices.append(local_pt)
-                
-                # Calculate UV coordinates based on world XY position
-                world_x = pt[0]  # Original world coordinates
-                world_y = pt[1]
-                
-                # Map world coordinates to UV (0-1 range)
-                # Swiss coordinates: X increases east, Y increases north
-                # glTF UV space: U increases right, V increases up (OpenGL convention)
-                # Both coordinate systems align, so no flip needed
-                u = (world_x - minx) / width
-                v = (world_y - miny) / height
-                
-                uv_coords.append([u, v])
-            
-            face_indices.append(vertex_map[pt_key])
-        
-        faces.append(face_indices)
-    
-    if not vertices or not faces:
+    if not triangles:
         logger.warning("No vertices or faces to create terrain mesh")
         return None
-    
-    # Create trimesh
-    vertices_array = np.array(vertices, dtype=np.float32)
-    faces_array = np.array(faces, dtype=np.uint32)
-    uv_array = np.array(uv_coords, dtype=np.float32)
+
+    # Flatten all triangle corners into one (N*3, 3) array, convert to
+    # local coordinates, then deduplicate shared vertices in a single
+    # numpy pass. The inverse mapping from np.unique is the flat face
+    # index array, so vertex lookup is pure advanced indexing.
+    world = np.asarray(triangles, dtype=np.float64).reshape(-1, 3)
+    local = world - np.array([offset_x, offset_y, offset_z])
+
+    unique_local, inverse = np.unique(
+        np.round(local, 6), axis=0, return_inverse=True
+    )
+
+    # Map world coordinates to UV (0-1 range)
+    # Swiss coordinates: X increases east, Y increases north
+    # glTF UV space: U increases right, V increases up (OpenGL convention)
+    # Both coordinate systems align, so no flip needed
+    u = (unique_local[:, 0] + offset_x - minx) / width
+    v = (unique_local[:, 1] + offset_y - miny) / height
+
+    vertices_array = unique_local.astype(np.float32)
+    faces_array = inverse.reshape(-1, 3).astype(np.uint32)
+    uv_array = np.column_stack([u, v]).astype(np.float32)
     
     mesh = trimesh.Trimesh(vertices=vertices_array, faces=faces_array)
     
@@ -104,6 +84,55 @@ def create_terrain_mesh_with_uvs(
     return mesh
 
 
+def _line_ribbon(
+    coords: List,
+    half_width: float,
+    offset_x: float,
+    offset_y: float,
+    offset_z: float,
+    z_lift: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a ribbon mesh along a polyline as (vertices, faces) arrays.
+
+    Vertices alternate left/right of the line; the per-point direction
+    and perpendicular are computed in one vectorized pass instead of a
+    Python loop with scalar math per point.
+    """
+    pts = np.asarray(coords, dtype=np.float64)
+    n = len(pts)
+
+    xy = pts[:, :2] - np.array([offset_x, offset_y])
+    if pts.shape[1] > 2:
+        z = pts[:, 2] - offset_z + z_lift
+    else:
+        z = np.full(n, z_lift)
+
+    # Direction per point: towards the next point, last point reuses
+    # the direction of its preceding segment
+    seg = np.diff(pts[:, :2], axis=0)
+    dirs = np.vstack([seg, seg[-1:]])
+    lengths = np.hypot(dirs[:, 0], dirs[:, 1])
+    valid = lengths > 0
+    normals = np.column_stack([
+        np.where(valid, -dirs[:, 1] / np.where(valid, lengths, 1.0), 0.0),
+        np.where(valid, dirs[:, 0] / np.where(valid, lengths, 1.0), 1.0)
+    ])
+
+    vertices = np.empty((2 * n, 3), dtype=np.float64)
+    vertices[0::2, :2] = xy + normals * half_width
+    vertices[1::2, :2] = xy - normals * half_width
+    vertices[0::2, 2] = z
+    vertices[1::2, 2] = z
+
+    idx = np.arange(n - 1)
+    faces = np.empty((2 * (n - 1), 3), dtype=np.uint32)
+    faces[0::2] = np.column_stack([2 * idx, 2 * idx + 2, 2 * idx + 1])
+    faces[1::2] = np.column_stack([2 * idx + 1, 2 * idx + 2, 2 * idx + 3])
+
+    return vertices.astype(np.float32), faces
+
+
 def create_road_meshes(
     roads: List,
     offset_x: float,
@@ -142,52 +171,15 @@ def create_road_meshes(
             # Get road width (default 4m)
             width = getattr(road, 'width', 4.0) or 4.0
             half_width = width / 2.0
-            
-            # Create a path mesh by extruding the line
-            # Build vertices for a ribbon along the road
-            vertices = []
-            faces = []
-            
-            for i, pt in enumerate(coords):
-                x = pt[0] - offset_x
-                y = pt[1] - offset_y
-                z = (pt[2] - offset_z if len(pt) > 2 else 0.0) + 0.1  # Slight offset above terrain
-                
-                # Calculate perpendicular direction for road width
-                if i < len(coords) - 1:
-                    dx = coords[i + 1][0] - pt[0]
-                    dy = coords[i + 1][1] - pt[1]
-                elif i > 0:
-                    dx = pt[0] - coords[i - 1][0]
-                    dy = pt[1] - coords[i - 1][1]
-                else:
-                    dx, dy = 1, 0
-                
-                # Normalize and get perpendicular
-                length = np.sqrt(dx * dx + dy * dy)
-                if length > 0:
-                    nx, ny = -dy / length, dx / length
-                else:
-                    nx, ny = 0, 1
-                
-                # Add left and right vertices
-                vertices.append([x + nx * half_width, y + ny * half_width, z])
-                vertices.append([x - nx * half_width, y - ny * half_width, z])
-            
-            # Create faces (quads as 2 triangles)
-            for i in range(len(coords) - 1):
-                v0 = i * 2
-                v1 = i * 2 + 1
-                v2 = (i + 1) * 2
-                v3 = (i + 1) * 2 + 1
-                faces.append([v0, v2, v1])
-                faces.append([v1, v2, v3])
-            
-            if vertices and faces:
-                mesh = trimesh.Trimesh(
-                    vertices=np.array(vertices, dtype=np.float32),
-                    faces=np.array(faces, dtype=np.uint32)
-                )
+
+            # Create a ribbon mesh along the road centerline
+            # (slight offset above terrain)
+            vertices, faces = _line_ribbon(
+                coords, half_width, offset_x, offset_y, offset_z, z_lift=0.1
+            )
+
+            if len(vertices) and len(faces):
+                mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
                 # Set road color (dark gray/asphalt)
                 mesh.visual.face_colors = [80, 80, 80, 255]  # RGBA
                 meshes.append(mesh)
@@ -236,46 +228,13 @@ def create_railway_meshes(
             # Railway width (standard gauge ~1.5m, with ballast ~3m)
             width = 3.0
             half_width = width / 2.0
-            
-            vertices = []
-            faces = []
-            
-            for i, pt in enumerate(coords):
-                x = pt[0] - offset_x
-                y = pt[1] - offset_y
-                z = (pt[2] - offset_z if len(pt) > 2 else 0.0) + 0.15  # Slight offset
-                
-                if i < len(coords) - 1:
-                    dx = coords[i + 1][0] - pt[0]
-                    dy = coords[i + 1][1] - pt[1]
-                elif i > 0:
-                    dx = pt[0] - coords[i - 1][0]
-                    dy = pt[1] - coords[i - 1][1]
-                else:
-                    dx, dy = 1, 0
-                
-                length = np.sqrt(dx * dx + dy * dy)
-                if length > 0:
-                    nx, ny = -dy / length, dx / length
-                else:
-                    nx, ny = 0, 1
-                
-                vertices.append([x + nx * half_width, y + ny * half_width, z])
-                vertices.append([x - nx * half_width, y - ny * half_width, z])
-            
-            for i in range(len(coords) - 1):
-                v0 = i * 2
-                v1 = i * 2 + 1
-                v2 = (i + 1) * 2
-                v3 = (i + 1) * 2 + 1
-                faces.append([v0, v2, v1])
-                faces.append([v1, v2, v3])
-            
-            if vertices and faces:
-                mesh = trimesh.Trimesh(
-                    vertices=np.array(vertices, dtype=np.float32),
-                    faces=np.array(faces, dtype=np.uint32)
-                )
+
+            vertices, faces = _line_ribbon(
+                coords, half_width, offset_x, offset_y, offset_z, z_lift=0.15
+            )
+
+            if len(vertices) and len(faces):
+                mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
                 # Set railway color (brown/gravel)
                 mesh.visual.face_colors = [139, 119, 101, 255]  # RGBA
                 meshes.append(mesh)
@@ -327,13 +286,13 @@ def create_building_meshes(
     total = len(buildings)
     if total > 100:
         import time
-        start_time = time.time()
+        start_time = time.perf_counter()
         last_log = 0
     
     for idx, building in enumerate(buildings):
         # Log progress for large batches
         if total > 100 and idx > 0 and idx % 100 == 0:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
             rate = idx / elapsed if elapsed > 0 else 0
             remaining = (total - idx) / rate if rate > 0 else 0
             logger.debug(f"Building meshes: {idx}/{total} ({elapsed:.1f}s, ~{remaining:.1f}s remaining)")
@@ -351,94 +310,74 @@ def create_building_meshes(
             logger.debug(f"Building {idx}: {getattr(building, 'id', 'unknown')}, {len(building.faces)} faces, has_uv={has_uv}")
         
         try:
-            # Build vertex map to deduplicate vertices
-            vertex_map = {}  # (x, y, z) -> vertex_index
-            vertices_list = []
-            uvs_list = [] if has_uv else None
-            all_faces = []
-            
+            # Stack all face vertices into one array so localization,
+            # deduplication and UV math run as vectorized numpy passes
+            # instead of a Python loop per vertex
+            face_arrays = []
+            face_sizes = []
             for face in building.faces:
                 if len(face) < 3:
                     continue
-                
-                # Convert face to numpy array for vectorized operations
-                face_array = np.array(face, dtype=np.float32)
-                n_pts = len(face_array)
-                
-                # Extract world coordinates
-                world_x = face_array[:, 0]
-                world_y = face_array[:, 1]
-                world_z = face_array[:, 2] if face_array.shape[1] > 2 else np.zeros(n_pts)
-                
-                # Convert to local coordinates (vectorized)
-                local_x = world_x - offset_x
-                local_y = world_y - offset_y
-                local_z = world_z - offset_z
-                
-                # Calculate UVs if needed (vectorized)
-                face_uvs = None
-                if has_uv:
-                    u = (world_x - minx) / width
-                    v = (world_y - miny) / height
-                    face_uvs = np.column_stack([u, v])
-                
-                # Map face vertices to unique vertex indices
-                face_indices = []
-                for i in range(n_pts):
-                    # Create vertex key (rounded for deduplication)
-                    vertex_key = (
-                        round(float(local_x[i]), 6),
-                        round(float(local_y[i]), 6),
-                        round(float(local_z[i]), 6)
-                    )
-                    
-                    if vertex_key not in vertex_map:
-                        # New vertex - add to map
-                        vertex_idx = len(vertices_list)
-                        vertex_map[vertex_key] = vertex_idx
-                        vertices_list.append([local_x[i], local_y[i], local_z[i]])
-                        if has_uv and face_uvs is not None:
-                            if uvs_list is None:
-                                uvs_list = []
-                            uvs_list.append([face_uvs[i, 0], face_uvs[i, 1]])
-                    else:
-                        # Existing vertex - reuse index
-                        vertex_idx = vertex_map[vertex_key]
-                    
-                    face_indices.append(vertex_idx)
-                
-                # Triangulate the face (fan triangulation)
+                face_array = np.asarray(face, dtype=np.float64)
+                if face_array.shape[1] < 3:
+                    face_array = np.column_stack([
+                        face_array, np.zeros(len(face_array))
+                    ])
+                face_arrays.append(face_array[:, :3])
+                face_sizes.append(len(face_array))
+
+            if not face_arrays:
+                continue
+
+            all_world = np.vstack(face_arrays)
+            all_local = all_world - np.array([offset_x, offset_y, offset_z])
+
+            # Deduplicate vertices (rounded, as before) in one unique pass;
+            # inverse maps every original vertex to its unique index
+            unique_local, inverse = np.unique(
+                np.round(all_local, 6), axis=0, return_inverse=True
+            )
+
+            # Fan-triangulate each face using the deduplicated indices
+            all_faces = []
+            cursor = 0
+            for n_pts in face_sizes:
+                face_indices = inverse[cursor:cursor + n_pts]
+                cursor += n_pts
                 for i in range(1, n_pts - 1):
                     all_faces.append([
                         face_indices[0],
                         face_indices[i],
                         face_indices[i + 1]
                     ])
-            
-            if vertices_list and all_faces:
-                # Convert to numpy arrays
-                vertices = np.array(vertices_list, dtype=np.float32)
+
+            # Cull degenerate slivers: fewer than 4 unique vertices or 4
+            # triangles cannot enclose a volume and only add draw calls
+            if len(unique_local) < 4 or len(all_faces) < 4:
+                logger.debug(f"Skipping degenerate building {getattr(building, 'id', 'unknown')} "
+                             f"({len(unique_local)} vertices, {len(all_faces)} triangles)")
+                continue
+
+            if len(unique_local) and all_faces:
+                vertices = unique_local.astype(np.float32)
                 faces = np.array(all_faces, dtype=np.uint32)
-                
+
                 mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
-                
+
                 # Apply UV coordinates if available
-                if has_uv and uvs_list and len(uvs_list) > 0:
-                    uv_array = np.array(uvs_list, dtype=np.float32)
-                    if len(uv_array) == len(vertices):
-                        mesh.visual.uv = uv_array
-                        # Texture material will be applied in export_gltf
-                    else:
-                        logger.warning(f"Building {getattr(building, 'id', 'unknown')}: UV count {len(uv_array)} != vertex count {len(vertices)}, skipping UV")
-                        mesh.visual.face_colors = [200, 190, 170, 255]  # RGBA
-                elif has_uv:
-                    # has_uv is True but no UVs were calculated
-                    logger.debug(f"Building {getattr(building, 'id', 'unknown')}: has_uv=True but uvs_list is empty (faces={len(building.faces)})")
-                    mesh.visual.face_colors = [200, 190, 170, 255]  # RGBA
+                if has_uv:
+                    # UVs derive from world XY of the deduplicated vertices
+                    world_xy = unique_local[:, :2] + np.array([offset_x, offset_y])
+                    uv_array = np.column_stack([
+                        (world_xy[:, 0] - minx) / width,
+                        (world_xy[:, 1] - miny) / height
+                    ]).astype(np.float32)
+                    mesh.visual.uv = uv_array
+                    # Texture material will be applied in export_gltf
                 else:
                     # No UV mapping requested
                     mesh.visual.face_colors = [200, 190, 170, 255]  # RGBA
-                
+
                 meshes.append(mesh)
                 
         except Exception as e:
@@ -489,11 +428,16 @@ def create_water_meshes(
             if len(coords) < 3:
                 continue
             
-            # Convert to local coordinates
-            local_coords = [(p[0] - offset_x, p[1] - offset_y, p[2] - offset_z if len(p) > 2 else 0.0) 
-                           for p in coords]
-            
-            vertices = np.array(local_coords, dtype=np.float32)
+            # Convert to local coordinates in one array operation
+            coords_arr = np.asarray(coords, dtype=np.float64)
+            if coords_arr.shape[1] > 2:
+                vertices = (coords_arr - np.array([offset_x, offset_y, offset_z])).astype(np.float32)
+            else:
+                vertices = np.column_stack([
+                    coords_arr[:, 0] - offset_x,
+                    coords_arr[:, 1] - offset_y,
+                    np.zeros(len(coords_arr))
+                ]).astype(np.float32)
             
             # Create triangulation
             try:
@@ -591,6 +535,6 @@ def export_gltf(
     except Exception as e:
         logger.error(f"Error exporting glTF: {e}")
         import traceback
-        traceback.print_exc()
+        logger.debug(traceback.format_exc())
         return False
 
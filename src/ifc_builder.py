@@ -20,6 +20,7 @@ import time
 import logging
 import ifcopenshell
 import ifcopenshell.api
+import numpy as np
 from shapely.geometry import Polygon
 from shapely.ops import triangulate
 from shapely.geometry.polygon import orient
@@ -143,9 +144,9 @@ def create_combined_ifc(terrain_triangles, site_solid_data, output_path, bounds,
     
     # Determine min_z from available data
     if terrain_triangles:
-        min_z = min(p[2] for tri in terrain_triangles for p in tri)
+        min_z = float(np.asarray(terrain_triangles, dtype=np.float64)[:, :, 2].min())
     elif site_solid_data:
-        min_z = min(z for _, _, z in site_solid_data['ext_coords'])
+        min_z = float(np.asarray(site_solid_data['ext_coords'], dtype=np.float64)[:, 2].min())
     else:
         min_z = 0.0
     offset_z = round(min_z)
@@ -218,22 +219,39 @@ def create_combined_ifc(terrain_triangles, site_solid_data, output_path, bounds,
         ifcopenshell.api.run("spatial.assign_container", model,
                               products=[terrain], relating_structure=site)
         
-        terrain_faces = []
+        # Store the terrain as one IfcTriangulatedFaceSet: a single
+        # coordinate list with deduplicated vertices (each grid vertex
+        # is shared by ~6 triangles) plus a flat triangle index list,
+        # instead of PolyLoop/Face/OpenShell entities per triangle
+        point_index = {}
+        point_coords = []
+        coord_index = []
         for tri in terrain_triangles:
-            local_pts = [(p[0] - offset_x, p[1] - offset_y, p[2] - offset_z) for p in tri]
-            tri_points = [
-                model.createIfcCartesianPoint([float(p[0]), float(p[1]), float(p[2])])
-                for p in local_pts
-            ]
-            tri_loop = model.createIfcPolyLoop(tri_points)
-            face = model.createIfcFace([model.createIfcFaceOuterBound(tri_loop, True)])
-            terrain_faces.append(face)
-        
-        terrain_shell = model.createIfcOpenShell(terrain_faces)
-        terrain_shell_model = model.createIfcShellBasedSurfaceModel([terrain_shell])
-        
+            face_indices = []
+            for p in tri:
+                local = (p[0] - offset_x, p[1] - offset_y, p[2] - offset_z)
+                key = (round(local[0], 6), round(local[1], 6), round(local[2], 6))
+                idx = point_index.get(key)
+                if idx is None:
+                    idx = len(point_coords) + 1  # IFC indices are 1-based
+                    point_index[key] = idx
+                    point_coords.append(
+                        [float(local[0]), float(local[1]), float(local[2])]
+                    )
+                face_indices.append(idx)
+            coord_index.append(face_indices)
+
+        terrain_point_list = model.createIfcCartesianPointList3D(point_coords)
+        terrain_face_set = model.createIfcTriangulatedFaceSet(
+            terrain_point_list,
+            None,   # Normals
+            False,  # Closed
+            coord_index,
+            None    # PnIndex
+        )
+
         terrain_rep = model.createIfcShapeRepresentation(
-            body_context, "Body", "SurfaceModel", [terrain_shell_model])
+            body_context, "Body", "Tessellation", [terrain_face_set])
         terrain.Representation = model.createIfcProductDefinitionShape(
             None, None, [terrain_rep])
         
@@ -260,14 +278,12 @@ def create_combined_ifc(terrain_triangles, site_solid_data, output_path, bounds,
                 )
                 
                 if texture:
-                    # Generate UV coordinates for all terrain vertices
-                    all_vertices = []
-                    for tri in terrain_triangles:
-                        for pt in tri:
-                            # Convert to local coordinates
-                            local_pt = (pt[0] - offset_x, pt[1] - offset_y, pt[2] - offset_z)
-                            all_vertices.append(local_pt)
-                    
+                    # Localize all terrain vertices in one array operation
+                    all_vertices = (
+                        np.asarray(terrain_triangles, dtype=np.float64).reshape(-1, 3)
+                        - np.array([offset_x, offset_y, offset_z])
+                    )
+
                     # Generate UV coordinates
                     uv_coords = generate_uv_coordinates(all_vertices, imagery_bbox)
                     
@@ -12,6 +12,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Successful geocoding results keyed on the normalized address string.
+# Scripts in one session frequently resolve the same address, and each
+# lookup otherwise costs a full HTTPS round-trip.
+_geocode_cache = {}
+
 
 class AddressResolver:
     """
@@ -40,6 +45,10 @@ class AddressResolver:
         Returns:
             Tuple of (easting, northing) in EPSG:2056, or None if not found
         """
+        cache_key = address.strip().lower()
+        if cache_key in _geocode_cache:
+            return _geocode_cache[cache_key]
+
         params = {
             "searchText": address,
             "type": "locations",
@@ -76,6 +85,7 @@ class AddressResolver:
             northing = float(x_val)
 
             logger.info(f"Geocoded '{address}' to E={easting:.1f}, N={northing:.1f}")
+            _geocode_cache[cache_key] = (easting, northing)
             return (easting, northing)
 
         except requests.RequestException as e:
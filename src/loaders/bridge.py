@@ -10,11 +10,13 @@ import time
 from typing import Optional, Tuple, List, Dict
 from dataclasses import dataclass
 
+import numpy as np
 import requests
 from shapely.geometry import LineString, Point
+from shapely.strtree import STRtree
 
 try:
-    from pyproj import Transformer
+    from src.loaders.crs import get_transformer
     PYPROJ_AVAILABLE = True
 except ImportError:
     PYPROJ_AVAILABLE = False
@@ -68,12 +70,8 @@ class SwissBridgeLoader:
         
         # Initialize coordinate transformer
         if PYPROJ_AVAILABLE:
-            self.transformer_to_2056 = Transformer.from_crs(
-                "EPSG:4326", "EPSG:2056", always_xy=True
-            )
-            self.transformer_to_wgs84 = Transformer.from_crs(
-                "EPSG:2056", "EPSG:4326", always_xy=True
-            )
+            self.transformer_to_2056 = get_transformer("EPSG:4326", "EPSG:2056")
+            self.transformer_to_wgs84 = get_transformer("EPSG:2056", "EPSG:4326")
         else:
             self.transformer_to_2056 = None
             self.transformer_to_wgs84 = None
@@ -98,6 +96,17 @@ class SwissBridgeLoader:
         min_x, min_y = self.wgs84_to_epsg2056(min_lon, min_lat)
         max_x, max_y = self.wgs84_to_epsg2056(max_lon, max_lat)
         return (min_x, min_y, max_x, max_y)
+
+    def wgs84_to_epsg2056_batch(self, lons, lats):
+        """Convert sequences of WGS84 coordinates to EPSG:2056 in one call"""
+        if self.transformer_to_2056:
+            return self.transformer_to_2056.transform(lons, lats)
+        else:
+            # Rough approximation if pyproj not available
+            logger.debug("Using approximate coordinate conversion (pyproj unavailable)")
+            lons = np.asarray(lons, dtype=np.float64)
+            lats = np.asarray(lats, dtype=np.float64)
+            return (lons - 7.44) * 111320 + 2600000, (lats - 46.0) * 111320 + 1200000
     
     @rate_limit_overpass
     def _request_overpass(self, query: str) -> Optional[Dict]:
@@ -272,17 +281,19 @@ out geom;
             if not geometry_data:
                 continue
             
-            # Convert coordinates from WGS84 to EPSG:2056
-            coords_2056 = []
-            for point in geometry_data:
-                lon = point.get('lon')
-                lat = point.get('lat')
-                if lon is not None and lat is not None:
-                    x, y = self.wgs84_to_epsg2056(lon, lat)
-                    coords_2056.append((x, y))
-            
-            if len(coords_2056) < 2:
+            # Convert coordinates from WGS84 to EPSG:2056 in one
+            # batched transform call instead of one PROJ call per node
+            lonlats = [
+                (point['lon'], point['lat'])
+                for point in geometry_data
+                if point.get('lon') is not None and point.get('lat') is not None
+            ]
+            if len(lonlats) < 2:
                 continue
+            xs, ys = self.wgs84_to_epsg2056_batch(
+                [ll[0] for ll in lonlats], [ll[1] for ll in lonlats]
+            )
+            coords_2056 = list(zip(xs, ys))
             
             # Create LineString
             try:
@@ -358,12 +369,16 @@ out geom;
         
         bridges = self.get_bridges_in_bbox(bbox, bridge_types)
         
-        # Filter to circular area
-        center = Point(x, y)
-        filtered = [
-            b for b in bridges
-            if b.geometry.distance(center) <= radius
-        ]
+        # Filter to circular area; dwithin runs the distance checks
+        # in GEOS over the tree instead of a per-bridge Python loop
+        if bridges:
+            tree = STRtree([b.geometry for b in bridges])
+            hits = tree.query(
+                Point(x, y), predicate="dwithin", distance=radius
+            )
+            filtered = [bridges[i] for i in sorted(hits)]
+        else:
+            filtered = []
         
         logger.info(f"Filtered {len(filtered)}/{len(bridges)} bridges within {radius}m radius")
         return filtered
@@ -417,10 +432,13 @@ out geom;
         else:
             search_area = site_boundary
         
-        filtered_bridges = [
-            b for b in bridges
-            if search_area.intersects(b.geometry)
-        ]
+        # STRtree prunes by bounding box before the exact GEOS test
+        if bridges:
+            tree = STRtree([b.geometry for b in bridges])
+            hits = tree.query(search_area, predicate="intersects")
+            filtered_bridges = [bridges[i] for i in sorted(hits)]
+        else:
+            filtered_bridges = []
         
         logger.info(
             f"Found {len(filtered_bridges)} bridges on parcel "
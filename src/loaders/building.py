@@ -33,9 +33,10 @@ except ImportError:
     FIONA_AVAILABLE = False
     logging.warning("fiona not available - GDB building fallback disabled")
 
+import numpy as np
 import requests
 from shapely.geometry import Polygon, box, Point, shape
-from pyproj import Transformer
+from src.loaders.crs import get_transformer
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,7 @@ class CityGMLBuildingLoader:
             timeout: Request timeout in seconds
         """
         self.timeout = timeout
-        self.transformer = Transformer.from_crs("EPSG:2056", "EPSG:4326", always_xy=True)
+        self.transformer = get_transformer("EPSG:2056", "EPSG:4326")
     
     def get_buildings_in_bbox(
         self,
@@ -183,7 +184,7 @@ class CityGMLBuildingLoader:
             response.raise_for_status()
             
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=65536):
                     if chunk:
                         f.write(chunk)
             
@@ -308,12 +309,11 @@ class CityGMLBuildingLoader:
                     continue
                 
                 coords_text = poslist.text.strip()
-                coords_list = [float(x) for x in coords_text.split()]
-                
-                # Group into XYZ triples
-                points = [(coords_list[i], coords_list[i+1], coords_list[i+2]) 
-                         for i in range(0, len(coords_list), 3)]
-                
+                # Let numpy convert the whole posList in C and reshape
+                # into XYZ triples instead of a per-token float() loop
+                coords_arr = np.array(coords_text.split(), dtype=np.float64)
+                points = [tuple(p) for p in coords_arr.reshape(-1, 3).tolist()]
+
                 if len(points) >= 3:
                     faces_data.append(points)
                     all_points.extend(points)
@@ -321,28 +321,27 @@ class CityGMLBuildingLoader:
             if not faces_data:
                 continue
             
-            # Calculate bounding box and centroid
-            xs = [p[0] for p in all_points]
-            ys = [p[1] for p in all_points]
-            zs = [p[2] for p in all_points]
-            
-            centroid_x = sum(xs) / len(xs)
-            centroid_y = sum(ys) / len(ys)
-            
+            # Calculate bounding box and centroid from one (N, 3) array
+            # instead of three list comprehensions plus min/max/sum passes
+            points_arr = np.asarray(all_points, dtype=np.float64)
+            mins = points_arr.min(axis=0)
+            maxs = points_arr.max(axis=0)
+            centroid_x, centroid_y = points_arr[:, :2].mean(axis=0)
+
             # Check if building intersects target area
-            building_bbox = box(min(xs), min(ys), max(xs), max(ys))
+            building_bbox = box(mins[0], mins[1], maxs[0], maxs[1])
             if not target_box.intersects(building_bbox):
                 continue
-            
+
             buildings.append(CityGMLBuilding(
                 id=bldg_id,
                 faces=faces_data,
                 height_max=height_max,
                 height_min=height_min,
                 building_type=building_type,
-                centroid=(centroid_x, centroid_y),
-                z_min=min(zs),
-                z_max=max(zs),
+                centroid=(float(centroid_x), float(centroid_y)),
+                z_min=float(mins[2]),
+                z_max=float(maxs[2]),
                 attributes=attrs
             ))
         
@@ -460,7 +459,7 @@ class CityGMLBuildingLoader:
             # Track download size
             downloaded = 0
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=65536):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
@@ -586,32 +585,32 @@ class CityGMLBuildingLoader:
                     if not faces or not all_points:
                         continue
                     
-                    # Calculate bounds
-                    xs = [p[0] for p in all_points]
-                    ys = [p[1] for p in all_points]
-                    zs = [p[2] for p in all_points]
-                    
+                    # Calculate bounds from one (N, 3) array instead of
+                    # three list comprehensions plus min/max/sum passes
+                    points_arr = np.asarray(all_points, dtype=np.float64)
+                    mins = points_arr.min(axis=0)
+                    maxs = points_arr.max(axis=0)
+
                     # Check if building intersects target area
-                    building_bbox = box(min(xs), min(ys), max(xs), max(ys))
+                    building_bbox = box(mins[0], mins[1], maxs[0], maxs[1])
                     if not target_box.intersects(building_bbox):
                         continue
-                    
+
                     # Extract properties
                     props = feat.get('properties', {})
                     building_id = str(props.get('UUID') or props.get('EGID') or feat.get('id', 'unknown'))
-                    
-                    centroid_x = sum(xs) / len(xs)
-                    centroid_y = sum(ys) / len(ys)
-                    
+
+                    centroid_x, centroid_y = points_arr[:, :2].mean(axis=0)
+
                     buildings.append(CityGMLBuilding(
                         id=building_id,
                         faces=faces,
                         height_max=props.get('DACH_MAX'),
                         height_min=props.get('DACH_MIN'),
                         building_type=props.get('OBJEKTART'),
-                        centroid=(centroid_x, centroid_y),
-                        z_min=min(zs),
-                        z_max=max(zs),
+                        centroid=(float(centroid_x), float(centroid_y)),
+                        z_min=float(mins[2]),
+                        z_max=float(maxs[2]),
                         attributes=props
                     ))
                     
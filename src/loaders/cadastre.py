@@ -5,6 +5,7 @@ Fetches cadastral parcel boundaries from Swiss geo.admin.ch API.
 """
 
 import requests
+from functools import lru_cache
 from shapely.geometry import shape, Polygon
 from typing import Tuple, Optional, Dict
 
@@ -12,13 +13,25 @@ from typing import Tuple, Optional, Dict
 def fetch_boundary_by_egrid(egrid: str) -> Tuple[Optional[Polygon], Optional[Dict]]:
     """
     Fetch the cadastral boundary (Polygon) and metadata for a given EGRID via geo.admin.ch API.
-    
+
+    Results are memoized per EGRID, so the terrain workflow and the various
+    feature loaders share a single boundary request instead of each fetching
+    the same parcel again.
+
     Args:
         egrid: Swiss EGRID identifier
-        
+
     Returns:
         Tuple: (Shapely geometry in EPSG:2056, metadata dict)
     """
+    geometry, metadata = _fetch_boundary_cached(egrid)
+    # Return a copy of the metadata so callers can't mutate the cached dict
+    return geometry, dict(metadata) if metadata is not None else None
+
+
+@lru_cache(maxsize=32)
+def _fetch_boundary_cached(egrid: str) -> Tuple[Optional[Polygon], Optional[Dict]]:
+    """Uncopied, cached boundary lookup backing fetch_boundary_by_egrid."""
     url = "https://api3.geo.admin.ch/rest/services/ech/MapServer/find"
     params = {
         "layer": "ch.kantone.cadastralwebmap-farbe",
@@ -0,0 +1,20 @@
+"""
+Shared coordinate transformer cache.
+
+Transformer.from_crs is expensive (PROJ pipeline construction), and
+every loader used to build its own instances - once per loader
+construction, so convenience functions that create a loader per call
+paid the cost repeatedly. This module memoizes transformers by CRS
+pair; pyproj transformers are thread-safe since 3.1, so sharing them
+across loaders (and the concurrent feature loads) is safe.
+"""
+
+from functools import lru_cache
+
+from pyproj import Transformer
+
+
+@lru_cache(maxsize=None)
+def get_transformer(src_crs: str, dst_crs: str) -> Transformer:
+    """Return a cached Transformer with always_xy axis order."""
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=True)
@@ -11,6 +11,7 @@ import logging
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Dict
 import requests
+from requests.adapters import HTTPAdapter
 from shapely.geometry import LineString, Point, Polygon
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,10 @@ class SwissTreeLoader:
         self.session.headers.update({
             "User-Agent": "SiteBoundariesGeom/1.0 (Tree Data Loader)"
         })
+        # Pool connections so repeated REST queries reuse TCP+TLS
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        )
     
     def get_trees_in_bounds(
         self,
@@ -71,7 +71,7 @@ class SwissImageryLoader:
     
     def _check_rate_limit(self):
         """Ensure we don't exceed rate limits."""
-        now = time.time()
+        now = time.perf_counter()
         # Remove requests older than the window
         self.request_times = [t for t in self.request_times if now - t < RATE_LIMIT_WINDOW]
         
@@ -83,10 +83,10 @@ class SwissImageryLoader:
                 logger.debug(f"Rate limit reached, waiting {wait_time:.1f}s")
                 time.sleep(wait_time)
                 # Clean up again after waiting
-                now = time.time()
+                now = time.perf_counter()
                 self.request_times = [t for t in self.request_times if now - t < RATE_LIMIT_WINDOW]
         
-        self.request_times.append(time.time())
+        self.request_times.append(time.perf_counter())
     
     def get_orthophoto_for_bbox(
         self,
@@ -177,6 +177,6 @@ class SwissImageryLoader:
         except Exception as e:
             logger.error(f"Error fetching WMS image: {e}")
             import traceback
-            traceback.print_exc()
+            logger.debug(traceback.format_exc())
             return None
 
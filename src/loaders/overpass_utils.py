@@ -20,11 +20,11 @@ def rate_limit_overpass(func):
     def wrapper(*args, **kwargs):
         global _last_request_time
         with _rate_limit_lock:
-            elapsed = time.time() - _last_request_time[0]
+            elapsed = time.perf_counter() - _last_request_time[0]
             left_to_wait = _min_request_interval - elapsed
             if left_to_wait > 0:
                 time.sleep(left_to_wait)
-            _last_request_time[0] = time.time()
+            _last_request_time[0] = time.perf_counter()
         
         return func(*args, **kwargs)
     return wrapper
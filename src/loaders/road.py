@@ -13,11 +13,14 @@ from functools import wraps
 from threading import Lock
 
 import requests
-from shapely.geometry import shape, box, LineString, MultiLineString, Polygon
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from shapely.geometry import shape, box, LineString, MultiLineString, Point, Polygon
 from shapely.ops import linemerge
+from shapely.strtree import STRtree
 
 try:
-    from pyproj import Transformer
+    from src.loaders.crs import get_transformer
     PYPROJ_AVAILABLE = True
 except ImportError:
     PYPROJ_AVAILABLE = False
@@ -60,11 +63,11 @@ def rate_limit(max_per_second: float):
         @wraps(func)
         def wrapper(*args, **kwargs):
             with lock:
-                elapsed = time.time() - last_called[0]
+                elapsed = time.perf_counter() - last_called[0]
                 left_to_wait = min_interval - elapsed
                 if left_to_wait > 0:
                     time.sleep(left_to_wait)
-                last_called[0] = time.time()
+                last_called[0] = time.perf_counter()
 
             result = func(*args, **kwargs)
             return result
@@ -119,14 +122,26 @@ class SwissRoadLoader:
         self.timeout = timeout
         self.retry_count = retry_count
 
+        # Session with connection pooling so repeated calls against
+        # api3.geo.admin.ch reuse the TCP+TLS connection; transient
+        # failures are retried inside the adapter with backoff
+        retry = Retry(
+            total=retry_count,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "POST"]),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=10, max_retries=retry
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         # Initialize coordinate transformer if available
         if PYPROJ_AVAILABLE:
-            self.transformer_to_wgs84 = Transformer.from_crs(
-                "EPSG:2056", "EPSG:4326", always_xy=True
-            )
-            self.transformer_to_2056 = Transformer.from_crs(
-                "EPSG:4326", "EPSG:2056", always_xy=True
-            )
+            self.transformer_to_wgs84 = get_transformer("EPSG:2056", "EPSG:4326")
+            self.transformer_to_2056 = get_transformer("EPSG:4326", "EPSG:2056")
         else:
             self.transformer_to_wgs84 = None
             self.transformer_to_2056 = None
@@ -169,29 +184,13 @@ class SwissRoadLoader:
         if self.retry_count < 1:
             raise ConfigurationError("retry_count must be at least 1")
 
-        last_exception = None
-
-        for attempt in range(self.retry_count):
-            try:
-                if method.upper() == "GET":
-                    response = requests.get(url, params=params, timeout=self.timeout)
-                else:
-                    response = requests.post(url, params=params, timeout=self.timeout)
-
-                response.raise_for_status()
-                return response
-
-            except requests.RequestException as e:
-                last_exception = e
-                logger.warning(f"Request failed (attempt {attempt + 1}/{self.retry_count}): {e}")
-
-                if attempt < self.retry_count - 1:
-                    # Exponential backoff
-                    time.sleep(2 ** attempt)
+        if method.upper() == "GET":
+            response = self._session.get(url, params=params, timeout=self.timeout)
+        else:
+            response = self._session.post(url, params=params, timeout=self.timeout)
 
-        if last_exception is None:
-            raise RuntimeError("Request failed but no exception was captured")
-        raise last_exception
+        response.raise_for_status()
+        return response
 
     def get_roads_rest(
         self,
@@ -365,13 +364,16 @@ class SwissRoadLoader:
 
         roads = self.get_roads_rest(bbox, layer=layer)
 
-        # Filter to circular area
-        from shapely.geometry import Point
-        center = Point(x, y)
-        filtered = [
-            r for r in roads
-            if r.geometry.distance(center) <= radius
-        ]
+        # Filter to circular area; dwithin runs the distance checks
+        # in GEOS over the tree instead of a per-road Python loop
+        if roads:
+            tree = STRtree([r.geometry for r in roads])
+            hits = tree.query(
+                Point(x, y), predicate="dwithin", distance=radius
+            )
+            filtered = [roads[i] for i in sorted(hits)]
+        else:
+            filtered = []
 
         logger.info(f"Filtered {len(filtered)}/{len(roads)} roads within {radius}m radius")
         return filtered
@@ -423,10 +425,13 @@ class SwissRoadLoader:
         else:
             search_area = site_boundary
 
-        filtered_roads = [
-            r for r in roads
-            if search_area.intersects(r.geometry)
-        ]
+        # STRtree prunes by bounding box before the exact GEOS test
+        if roads:
+            tree = STRtree([r.geometry for r in roads])
+            hits = tree.query(search_area, predicate="intersects")
+            filtered_roads = [roads[i] for i in sorted(hits)]
+        else:
+            filtered_roads = []
 
         logger.info(
             f"Found {len(filtered_roads)} roads on parcel "
@@ -0,0 +1,32 @@
+"""
+Optional on-disk cache for downloaded tile archives.
+
+The Swiss STAC tile assets (GDB and CityGML zips, ~10-15 MB each) are
+versioned by URL, so a byte-for-byte re-download of the same URL always
+yields the same archive. Setting SITE_TILE_CACHE_DIR keeps a copy of
+each downloaded archive keyed by URL hash, letting repeat runs (local
+iteration, CI re-runs) skip the network entirely. Unset, caching is
+disabled and loaders behave as before.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+
+def cache_path_for(url: str) -> Optional[Path]:
+    """
+    Return the cache file path for a tile URL, or None if caching is off.
+
+    The parent directory is created on demand; callers check existence
+    themselves and are responsible for writing atomically (write to a
+    temp name, then os.replace).
+    """
+    cache_dir = os.environ.get("SITE_TILE_CACHE_DIR")
+    if not cache_dir:
+        return None
+
+    root = Path(cache_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    return root / (hashlib.sha256(url.encode("utf-8")).hexdigest() + ".zip")
@@ -82,8 +82,16 @@ class SwissWaterLoader:
         # Remove river features that overlap with lakes
         if lake_features and river_features:
             lake_union = unary_union([f.geometry for f in lake_features])
+            lake_minx, lake_miny, lake_maxx, lake_maxy = lake_union.bounds
             filtered_rivers = []
             for rf in river_features:
+                # Cheap bbox rejection first - most rivers are nowhere
+                # near a lake and skip the GEOS intersection/difference
+                r_minx, r_miny, r_maxx, r_maxy = rf.geometry.bounds
+                if (r_maxx < lake_minx or r_minx > lake_maxx
+                        or r_maxy < lake_miny or r_miny > lake_maxy):
+                    filtered_rivers.append(rf)
+                    continue
                 try:
                     # Keep river if it doesn't overlap significantly with lakes
                     overlap = rf.geometry.intersection(lake_union).area
@@ -121,7 +129,9 @@ class SwissWaterLoader:
         
         # Fetch elevations
         if clipped and fetch_elevations_func:
-            coords = [(f.geometry.centroid.x, f.geometry.centroid.y) for f in clipped]
+            # One GEOS centroid call per feature instead of two
+            centroids = [f.geometry.centroid for f in clipped]
+            coords = [(c.x, c.y) for c in centroids]
             if coords:
                 elevations = fetch_elevations_func(coords)
                 for feature, elev in zip(clipped, elevations, strict=True):
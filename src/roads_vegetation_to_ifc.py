@@ -6,7 +6,8 @@ into IFC geographic element representations.
 """
 
 import logging
-from typing import List, Optional, Tuple
+import math
+from typing import Dict, List, Optional, Tuple
 
 import ifcopenshell
 import ifcopenshell.api
@@ -75,8 +76,26 @@ CONIFEROUS_COLOR_RGB = (0.1, 0.35, 0.15)  # Dark green
 TRUNK_COLOR_RGB = (0.4, 0.25, 0.1)  # Brown
 
 
+def _find_surface_style(model: ifcopenshell.file, name: str):
+    """
+    Return the model's existing IfcSurfaceStyle with this name, if any.
+
+    Looking the style up in the model itself (rather than a module-level
+    cache) keeps each model to one shared style entity per name without
+    holding a reference to the model beyond its own lifetime.
+    """
+    for style in model.by_type("IfcSurfaceStyle"):
+        if style.Name == name:
+            return style
+    return None
+
+
 def _create_road_style(model: ifcopenshell.file) -> ifcopenshell.entity_instance:
     """Create a dark asphalt surface style for roads."""
+    existing = _find_surface_style(model, "RoadAsphalt")
+    if existing is not None:
+        return existing
+
     # Create surface color
     colour = model.createIfcColourRgb(None, *ROAD_COLOR_RGB)
     
@@ -99,7 +118,7 @@ def _create_road_style(model: ifcopenshell.file) -> ifcopenshell.entity_instance
         "BOTH",
         [rendering]
     )
-    
+
     return surface_style
 
 
@@ -113,17 +132,20 @@ def _create_water_style(model: ifcopenshell.file, is_underground: bool = False)
     Returns:
         IfcSurfaceStyle for water
     """
+    style_name = "WaterUnderground" if is_underground else "WaterSurface"
+    existing = _find_surface_style(model, style_name)
+    if existing is not None:
+        return existing
+
     if is_underground:
         # Underground water: more transparent, darker color
         colour = model.createIfcColourRgb(None, *WATER_UNDERGROUND_COLOR_RGB)
         transparency = 0.6  # More transparent to indicate underground
-        style_name = "WaterUnderground"
     else:
         # Surface water: darker greenish tint
         colour = model.createIfcColourRgb(None, *WATER_SURFACE_COLOR_RGB)
         transparency = 0.25  # Slightly transparent
-        style_name = "WaterSurface"
-    
+
     # Create surface style rendering
     rendering = model.createIfcSurfaceStyleRendering(
         colour,
@@ -143,7 +165,7 @@ def _create_water_style(model: ifcopenshell.file, is_underground: bool = False)
         "BOTH",
         [rendering]
     )
-    
+
     return surface_style
 
 
@@ -524,13 +546,7 @@ def water_to_ifc(
     if water.geometry is None or water.geometry.is_empty:
         logger.warning(f"Skipping water {water.id}: no geometry")
         return None
-    
-    try:
-        from shapely.geometry import LineString, Polygon
-    except ImportError:
-        logger.error("Shapely required for water conversion")
-        return None
-    
+
     # Create IfcGeographicElement for water
     water_name = water.name or f"{water.water_type.capitalize()}_{water.id}"
     ifc_water = ifcopenshell.api.run(
@@ -806,7 +822,6 @@ def waters_to_ifc(
         coord_counts = []
         for water in waters:
             if water.geometry and not water.geometry.is_empty:
-                from shapely.geometry import LineString, Polygon
                 if isinstance(water.geometry, LineString):
                     coords = list(water.geometry.coords)
                     all_coords.extend([(c[0], c[1]) for c in coords])
@@ -883,7 +898,6 @@ def _create_tree_geometry(
     
     # Create trunk (cylinder)
     # Create circular profile for trunk
-    import math
     num_segments = 8  # 8-sided circle for trunk
     trunk_profile_points = []
     for i in range(num_segments):
@@ -1050,7 +1064,6 @@ def tree_to_ifc(
     canopy_radius = DEFAULT_TREE_CANOPY_RADIUS
     if vegetation.canopy_area:
         # Estimate radius from area: area = π * r²
-        import math
         canopy_radius = math.sqrt(vegetation.canopy_area / math.pi)
         canopy_radius = max(2.0, min(canopy_radius, 8.0))  # Clamp between 2-8m
     
@@ -1555,7 +1568,6 @@ def _create_tree_type_geometry(
     Returns:
         IfcShapeRepresentation or None
     """
-    import math
     
     # Calculate dimensions
     trunk_height = height * FOREST_TRUNK_HEIGHT_RATIO
@@ -1787,7 +1799,14 @@ def forest_to_ifc(
     ifc_trees = []
     deciduous_count = 0
     coniferous_count = 0
-    
+
+    # Type links and spatial containment are accumulated per loop and
+    # written with one api call per relationship afterwards - the
+    # per-instance api.run calls re-dispatch and rebuild relationships
+    # for every single tree
+    type_members: Dict[ifcopenshell.entity_instance, List] = {}
+    placed_trees = []
+
     for i, tree_feature in enumerate(forest_points):
         # Handle hedges differently
         if tree_feature.feature_type == "hedge":
@@ -1835,14 +1854,9 @@ def forest_to_ifc(
                 ifc_tree.PredefinedType = "USERDEFINED"
                 ifc_tree.ObjectType = "TREE"
                 
-                # Link to type (this reuses geometry!)
-                ifcopenshell.api.run(
-                    "type.assign_type",
-                    model,
-                    related_objects=[ifc_tree],
-                    relating_type=tree_type
-                )
-                
+                # Link to type later in one batched call (reuses geometry!)
+                type_members.setdefault(tree_type, []).append(ifc_tree)
+
                 # Get elevation for this point
                 tree_z = tree_feature.z  # Use feature elevation (or could interpolate)
                 
@@ -1859,14 +1873,7 @@ def forest_to_ifc(
                 )
                 ifc_tree.ObjectPlacement = tree_placement
                 
-                # Assign to site
-                ifcopenshell.api.run(
-                    "spatial.assign_container",
-                    model,
-                    products=[ifc_tree],
-                    relating_structure=site
-                )
-                
+                placed_trees.append(ifc_tree)
                 ifc_trees.append(ifc_tree)
                 if is_deciduous:
                     deciduous_count += 1
@@ -1899,14 +1906,9 @@ def forest_to_ifc(
         ifc_tree.PredefinedType = "USERDEFINED"
         ifc_tree.ObjectType = "TREE"
         
-        # Link to type (this reuses geometry!)
-        ifcopenshell.api.run(
-            "type.assign_type",
-            model,
-            related_objects=[ifc_tree],
-            relating_type=tree_type
-        )
-        
+        # Link to type later in one batched call (reuses geometry!)
+        type_members.setdefault(tree_type, []).append(ifc_tree)
+
         # Create placement at tree position
         local_x = tree_feature.x - offset_x
         local_y = tree_feature.y - offset_y
@@ -1920,20 +1922,30 @@ def forest_to_ifc(
         )
         ifc_tree.ObjectPlacement = tree_placement
         
-        # Assign to site
-        ifcopenshell.api.run(
-            "spatial.assign_container",
-            model,
-            products=[ifc_tree],
-            relating_structure=site
-        )
-        
+        placed_trees.append(ifc_tree)
         ifc_trees.append(ifc_tree)
         if is_deciduous:
             deciduous_count += 1
         else:
             coniferous_count += 1
-    
+
+    # One relationship per tree type and one containment for all trees
+    for tree_type, members in type_members.items():
+        ifcopenshell.api.run(
+            "type.assign_type",
+            model,
+            related_objects=members,
+            relating_type=tree_type
+        )
+
+    if placed_trees:
+        ifcopenshell.api.run(
+            "spatial.assign_container",
+            model,
+            products=placed_trees,
+            relating_structure=site
+        )
+
     logger.info(f"Created {len(ifc_trees)} trees using 6 type definitions ({deciduous_count} deciduous, {coniferous_count} coniferous)")
     return ifc_trees
 
@@ -2000,7 +2012,6 @@ def _create_railway_type_geometry(
     Returns:
         IfcShapeRepresentation or None
     """
-    import math
     
     half_gauge = gauge / 2.0
     half_sleeper_length = SLEEPER_LENGTH / 2.0
@@ -2318,7 +2329,6 @@ def railway_to_ifc(
     
     # Create proper railway geometry with two rails and instanced sleepers
     representations = []
-    import math
     
     # Prepare coordinates relative to placement origin
     # Ballast sits at terrain level with BALLAST_TOP_OFFSET above, extending BALLAST_DEPTH below
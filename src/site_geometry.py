@@ -5,7 +5,6 @@ Functions for creating site solids and calculating height offsets.
 """
 
 import numpy as np
-import math
 from shapely.geometry import Polygon
 from typing import List, Tuple
 
@@ -91,7 +90,7 @@ def create_site_solid_coords(site_polygon, site_coords_3d: List[Tuple[float, flo
     
     ext_coords = [(ext_coords[i][0], ext_coords[i][1], adjusted_z[i]) for i in range(len(ext_coords))]
     
-    base_elevation = min(z for _, _, z in ext_coords) - 2.0  # 2 meters below lowest point
+    base_elevation = float(np.asarray(adjusted_z).min()) - 2.0  # 2 meters below lowest point
     
     # Create 2D polygon for triangulation
     polygon_2d = Polygon([(x, y) for x, y, _ in ext_coords])
@@ -120,23 +119,19 @@ def calculate_height_offset(site_polygon, site_coords_3d: List[Tuple[float, floa
         # Use spatial index for large datasets (O(n log n) instead of O(n×m))
         terrain_points = np.array(terrain_coords)
         tree = cKDTree(terrain_points)
-        for x, y, _ in site_coords_3d:
-            _, idx = tree.query([x, y], k=1)
-            boundary_terrain_z.append(terrain_elevations[idx])
+        # One batched query instead of a Python loop of single queries
+        query_points = np.array([(x, y) for x, y, _ in site_coords_3d])
+        _, indices = tree.query(query_points, k=1)
+        boundary_terrain_z = [terrain_elevations[idx] for idx in indices]
     else:
-        # Fallback to linear search for small datasets or when scipy unavailable
-        for x, y, _ in site_coords_3d:
-            # Find closest terrain point
-            min_dist = float('inf')
-            closest_z = None
-            for idx, (tx, ty) in enumerate(terrain_coords):
-                dist = math.sqrt((tx - x)**2 + (ty - y)**2)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_z = terrain_elevations[idx]
-            
-            if closest_z is not None:
-                boundary_terrain_z.append(closest_z)
+        # Fallback for small datasets or when scipy unavailable: compare
+        # squared distances (argmin is unaffected by the sqrt) and let
+        # numpy scan the terrain points instead of a per-pair Python loop
+        terrain_arr = np.asarray(terrain_coords, dtype=np.float64)
+        if len(terrain_arr):
+            for x, y, _ in site_coords_3d:
+                sq_dist = (terrain_arr[:, 0] - x)**2 + (terrain_arr[:, 1] - y)**2
+                boundary_terrain_z.append(terrain_elevations[int(np.argmin(sq_dist))])
     
     if not boundary_terrain_z:
         return 0.0
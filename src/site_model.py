@@ -6,8 +6,11 @@ Main workflow orchestrator for generating IFC site models with terrain, site sol
 """
 
 import numpy as np
+import shapely
+from shapely.geometry import Point
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from src.elevation import fetch_elevation_batch
 from src.loaders.cadastre import fetch_boundary_by_egrid
 from src.terrain_mesh import create_circular_terrain_grid, apply_road_recesses_to_terrain, apply_water_cutouts_to_terrain, triangulate_terrain_with_cutout
@@ -121,6 +124,7 @@ def run_combined_terrain_workflow(
     z_offset = None
     roads = None  # Initialize roads variable
     waters = None  # Initialize waters variable (loaded early for terrain cutouts)
+    railways = None  # Initialize railways variable (loaded early for terrain cutouts)
     
     # Calculate circle_bounds early - used for water/road/forest loading even if terrain disabled
     circle_bounds = (
@@ -130,14 +134,19 @@ def run_combined_terrain_workflow(
         center_y + radius
     )
 
+    # Circular terrain boundary, shared by every feature-clipping step
+    # below instead of being rebuilt per feature type
+    terrain_boundary = Point(center_x, center_y).buffer(radius, resolution=64)
+
     # Get site boundary 3D coordinates
     ring = site_geometry.exterior
     distances = np.arange(0, ring.length, densify)
     if distances[-1] < ring.length:
         distances = np.append(distances, ring.length)
 
-    site_points = [ring.interpolate(d) for d in distances]
-    site_coords_2d = [(p.x, p.y) for p in site_points]
+    # Shapely 2 interpolates the whole distance array in one GEOS call
+    site_points = ring.interpolate(distances)
+    site_coords_2d = [tuple(c) for c in shapely.get_coordinates(site_points)]
 
     print(f"\nFetching site boundary elevations ({len(site_coords_2d)} points)...")
     site_elevations = fetch_elevation_batch(site_coords_2d)
@@ -194,9 +203,6 @@ def run_combined_terrain_workflow(
             print("\nApplying road recesses to terrain...")
             
             # Clip road geometries to terrain boundary (for IFC output)
-            from shapely.geometry import Point
-            terrain_boundary = Point(center_x, center_y).buffer(radius, resolution=64)
-            
             clipped_roads = []
             from src.loaders.road import RoadFeature
             for r in roads:
@@ -262,10 +268,6 @@ def run_combined_terrain_workflow(
                 # Apply water cutouts for surface water
                 if waters:
                     print("\nApplying surface water cutouts to terrain...")
-                    # Create terrain boundary for clipping lakes
-                    from shapely.geometry import Point, Polygon, LineString
-                    terrain_boundary = Point(center_x, center_y).buffer(radius, resolution=64)
-                    
                     # CLIP water feature geometries to terrain boundary (for IFC output)
                     clipped_waters = []
                     for w in waters:
@@ -323,10 +325,8 @@ def run_combined_terrain_workflow(
                 
                 # Clip railways to radius
                 if railways:
-                    from shapely.geometry import Point
                     from shapely.ops import linemerge
-                    terrain_boundary = Point(center_x, center_y).buffer(radius, resolution=64)
-                    
+
                     clipped_railways = []
                     for r in railways:
                         if r.geometry is None or r.geometry.is_empty:
@@ -413,26 +413,28 @@ def run_combined_terrain_workflow(
             'smoothed_boundary_z': smoothed_boundary_z
         }
 
-    # Load additional features if requested
-    forest_points = None
-    if include_forest:
+    # Load additional features if requested. The remaining loads are
+    # independent HTTP fetches, so they run concurrently in a thread pool
+    # and wall time shrinks to roughly the slowest single fetch.
+    def _load_forest():
         print(f"\nLoading forest trees...")
         try:
             from src.loaders.forest import SwissTreeLoader
             loader = SwissTreeLoader()
             bounds = circle_bounds if circle_bounds else site_geometry.bounds
             forest_points = loader.get_trees_in_bounds(
-                bounds, 
+                bounds,
                 fetch_elevations_func=fetch_elevation_batch,
                 max_features=1000  # Limit to reasonable number
             )
             print(f"  Found {len(forest_points)} trees/hedges")
+            return forest_points
         except Exception as e:
             logger.exception("Error loading forest")
-            forest_points = None
+            return None
 
     # If water wasn't loaded during terrain processing (e.g., terrain disabled), load it now
-    if include_water and waters is None:
+    def _load_water():
         print(f"\nLoading water features...")
         try:
             from src.loaders.water import SwissWaterLoader
@@ -440,13 +442,14 @@ def run_combined_terrain_workflow(
             bounds = circle_bounds if circle_bounds else site_geometry.bounds
             waters = loader.get_water_in_bounds(bounds)
             print(f"  Found {len(waters)} water features")
+            return waters
         except Exception as e:
             logger.exception("Error loading water")
-            waters = None
+            return None
 
     # Railways should already be loaded during terrain processing
     # If terrain was skipped, railways will be None - load them now
-    if include_railways and railways is None:
+    def _load_railways():
         print(f"\nLoading railways (radius: {radius}m)...")
         try:
             from src.loaders.railway import SwissRailwayLoader, RailwayFeature
@@ -459,10 +462,8 @@ def run_combined_terrain_workflow(
             
             # Clip railways to radius
             if railways:
-                from shapely.geometry import Point
                 from shapely.ops import linemerge
-                terrain_boundary = Point(center_x, center_y).buffer(radius, resolution=64)
-                
+
                 clipped_railways = []
                 for r in railways:
                     if r.geometry is None or r.geometry.is_empty:
@@ -496,22 +497,12 @@ def run_combined_terrain_workflow(
                 
                 print(f"  Clipped {len(clipped_railways)} railways to radius")
                 railways = clipped_railways
+            return railways
         except Exception:
             logger.exception("Error loading railways")
-            railways = None
-    
-    # Show railway info
-    if railways:
-        railway_types = {}
-        for r in railways:
-            rt = r.railway_type or "unknown"
-            railway_types[rt] = railway_types.get(rt, 0) + 1
-        print(f"  Railway types ({len(railways)} total):")
-        for rt, count in railway_types.items():
-            print(f"    - {rt}: {count}")
+            return None
 
-    bridges = None
-    if include_bridges:
+    def _load_bridges():
         print(f"\nLoading bridges (radius: {radius}m)...")
         try:
             from src.loaders.bridge import SwissBridgeLoader, BridgeFeature
@@ -522,10 +513,8 @@ def run_combined_terrain_workflow(
             
             # Clip bridges to radius
             if bridges:
-                from shapely.geometry import Point
                 from shapely.ops import linemerge
-                terrain_boundary = Point(center_x, center_y).buffer(radius, resolution=64)
-                
+
                 clipped_bridges = []
                 for b in bridges:
                     if b.geometry is None or b.geometry.is_empty:
@@ -571,12 +560,12 @@ def run_combined_terrain_workflow(
                 print("  Bridge types:")
                 for ct, count in carries_types.items():
                     print(f"    - {ct}: {count}")
+            return bridges
         except Exception:
             logger.exception("Error loading bridges")
-            bridges = None
+            return None
 
-    buildings = None
-    if include_buildings:
+    def _load_buildings():
         print("\nLoading buildings...")
         try:
             from src.loaders.building import CityGMLBuildingLoader
@@ -590,38 +579,72 @@ def run_combined_terrain_workflow(
             if buildings:
                 for i, b in enumerate(buildings[:5]):
                     print(f"    {i+1}. {b.id[:40]}... - {b.building_type if b.building_type else 'unknown'} - {len(b.faces)} faces")
+            return buildings
         except Exception as e:
             logger.exception("Error loading buildings")
-            buildings = None
+            return None
 
-    # Load satellite imagery if requested
-    imagery_data = None
-    if include_satellite_overlay:
+    def _load_imagery():
         print(f"\nLoading satellite imagery (resolution: {imagery_resolution}m)...")
         try:
             from src.loaders.imagery import SwissImageryLoader
-            
+
             loader = SwissImageryLoader()
             # Use circle bounds for imagery coverage
             imagery_bbox = circle_bounds if circle_bounds else bounds
             year = imagery_year if imagery_year else "current"
-            
+
             imagery_result = loader.get_orthophoto_for_bbox(
                 imagery_bbox,
                 resolution_m=imagery_resolution,
                 year=year
             )
-            
+
             if imagery_result:
-                imagery_data = imagery_result
                 print(f"  Satellite imagery loaded successfully")
-            else:
-                logger.warning("Failed to load satellite imagery, continuing without texture")
+                return imagery_result
+            logger.warning("Failed to load satellite imagery, continuing without texture")
+            return None
         except Exception as e:
             logger.exception("Error loading satellite imagery")
             print(f"  Warning: Could not load satellite imagery: {e}")
-            imagery_data = None
-    
+            return None
+
+    # Dispatch the requested loads concurrently and collect results
+    feature_tasks = {}
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        if include_forest:
+            feature_tasks["forest"] = executor.submit(_load_forest)
+        if include_water and waters is None:
+            feature_tasks["water"] = executor.submit(_load_water)
+        if include_railways and railways is None:
+            feature_tasks["railways"] = executor.submit(_load_railways)
+        if include_bridges:
+            feature_tasks["bridges"] = executor.submit(_load_bridges)
+        if include_buildings:
+            feature_tasks["buildings"] = executor.submit(_load_buildings)
+        if include_satellite_overlay:
+            feature_tasks["imagery"] = executor.submit(_load_imagery)
+
+    forest_points = feature_tasks["forest"].result() if "forest" in feature_tasks else None
+    if "water" in feature_tasks:
+        waters = feature_tasks["water"].result()
+    if "railways" in feature_tasks:
+        railways = feature_tasks["railways"].result()
+    bridges = feature_tasks["bridges"].result() if "bridges" in feature_tasks else None
+    buildings = feature_tasks["buildings"].result() if "buildings" in feature_tasks else None
+    imagery_data = feature_tasks["imagery"].result() if "imagery" in feature_tasks else None
+
+    # Show railway info
+    if railways:
+        railway_types = {}
+        for r in railways:
+            rt = r.railway_type or "unknown"
+            railway_types[rt] = railway_types.get(rt, 0) + 1
+        print(f"  Railway types ({len(railways)} total):")
+        for rt, count in railway_types.items():
+            print(f"    - {rt}: {count}")
+
     # Create IFC file
     print(f"\nCreating IFC file: {output_path}")
     result = create_combined_ifc(
@@ -718,12 +741,12 @@ def run_combined_terrain_workflow(
                 else:
                     print(f"  Creating {len(buildings)} building meshes with default color...")
                 import time
-                start_time = time.time()
+                start_time = time.perf_counter()
                 building_mesh_list = create_building_meshes(
                     buildings, offset_x, offset_y, offset_z,
                     imagery_bbox=imagery_bbox if apply_texture_to_buildings else None  # Only pass bbox if textures enabled
                 )
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 other_meshes.extend(building_mesh_list)
                 if building_mesh_list:
                     print(f"  Created {len(building_mesh_list)} building meshes in {elapsed:.1f}s")
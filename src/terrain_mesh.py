@@ -33,16 +33,14 @@ def create_circular_terrain_grid(center_x: float, center_y: float, radius: float
     x_range = np.arange(minx, maxx + resolution, resolution)
     y_range = np.arange(miny, maxy + resolution, resolution)
     
-    # Filter points to only include those within the circle
-    coords = []
-    center_point = Point(center_x, center_y)
-    circle = center_point.buffer(radius)
-    
-    for y in y_range:
-        for x in x_range:
-            point = Point(x, y)
-            if circle.contains(point) or circle.boundary.distance(point) < resolution * 0.1:
-                coords.append((x, y))
+    # Filter points to only include those within the circle. Distances
+    # for the whole grid are computed in one vectorized pass instead of
+    # constructing a shapely Point per cell; the tolerance keeps the same
+    # rim band as the previous boundary-distance check.
+    xx, yy = np.meshgrid(x_range, y_range)
+    dist = np.hypot(xx - center_x, yy - center_y)
+    mask = dist <= radius + resolution * 0.1
+    coords = list(zip(xx[mask].tolist(), yy[mask].tolist()))
     
     print(f"Created circular grid: {len(coords)} points within {radius}m radius")
     print(f"Circle center: E {center_x:.1f}, N {center_y:.1f}")
@@ -528,13 +526,15 @@ def triangulate_terrain_with_cutout(
     terrain_z = np.array(elevations)
     linear_interp = LinearNDInterpolator(terrain_pts, terrain_z)
     nearest_interp = NearestNDInterpolator(terrain_pts, terrain_z)
-    
-    def get_elevation(x, y):
-        z = linear_interp([[x, y]])[0]
-        if np.isnan(z):
-            z = nearest_interp([[x, y]])[0]
-        return float(z)
-    
+
+    def get_elevations(points):
+        """Interpolate elevations for an (N, 2) array in one scipy call."""
+        z = linear_interp(points)
+        nan_mask = np.isnan(z)
+        if nan_mask.any():
+            z[nan_mask] = nearest_interp(points[nan_mask])
+        return z
+
     # Triangulate each polygon using earcut
     triangles_3d = []
     
@@ -565,24 +565,17 @@ def triangulate_terrain_with_cutout(
             rings_arr = np.array(ring_ends, dtype=np.uint32)
             
             # Run earcut triangulation
-            tri_indices = earcut.triangulate_float64(vertices, rings_arr)
-            num_tris = len(tri_indices) // 3
-            
-            # Convert to 3D triangles with elevations
-            for i in range(0, len(tri_indices), 3):
-                i0, i1, i2 = tri_indices[i], tri_indices[i+1], tri_indices[i+2]
-                v0, v1, v2 = vertices[i0], vertices[i1], vertices[i2]
-                
-                z0 = get_elevation(v0[0], v0[1])
-                z1 = get_elevation(v1[0], v1[1])
-                z2 = get_elevation(v2[0], v2[1])
-                
-                triangles_3d.append([
-                    (v0[0], v0[1], z0),
-                    (v1[0], v1[1], z1),
-                    (v2[0], v2[1], z2)
-                ])
-            
+            tri_indices = np.asarray(
+                earcut.triangulate_float64(vertices, rings_arr), dtype=np.int64
+            ).reshape(-1, 3)
+
+            # Interpolate all ring vertices in one batched scipy call,
+            # then gather the 3D triangles with advanced indexing instead
+            # of three interpolator round-trips per triangle
+            vertices_3d = np.column_stack([vertices, get_elevations(vertices)])
+            for tri in vertices_3d[tri_indices].tolist():
+                triangles_3d.append([tuple(v) for v in tri])
+
         except Exception as e:
             logger.warning(f"Earcut failed for polygon: {e}")
             continue
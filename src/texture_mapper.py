@@ -7,6 +7,7 @@ Functions for creating IFC texture entities and applying UV mapping to geometry.
 import logging
 from typing import List, Tuple, Optional
 import ifcopenshell
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -33,16 +34,14 @@ def generate_uv_coordinates(
         logger.warning(f"Invalid bbox dimensions: {bbox}")
         return [(0.0, 0.0)] * len(vertices)
     
-    uvs = []
-    for x, y, z in vertices:
-        u = (x - minx) / width
-        v = (y - miny) / height
-        # Note: IFC uses (0,0) at bottom-left, but PIL images use top-left
-        # We'll flip V coordinate to match IFC convention
-        v = 1.0 - v
-        uvs.append((u, v))
-    
-    return uvs
+    # Vectorized over all vertices; for a dense terrain this is a few
+    # array operations instead of one Python iteration per vertex.
+    # Note: IFC uses (0,0) at bottom-left, but PIL images use top-left,
+    # so the V coordinate is flipped to match IFC convention.
+    verts = np.asarray(vertices, dtype=np.float64)
+    u = (verts[:, 0] - minx) / width
+    v = 1.0 - (verts[:, 1] - miny) / height
+    return list(zip(u.tolist(), v.tolist()))
 
 
 def create_texture_from_image(
@@ -217,7 +216,7 @@ def apply_texture_to_element(
     except Exception as e:
         logger.error(f"Error applying texture to element: {e}")
         import traceback
-        traceback.print_exc()
+        logger.debug(traceback.format_exc())
         return False
 
 
@@ -273,6 +272,6 @@ def apply_texture_to_faces(
     except Exception as e:
         logger.error(f"Error applying texture to faces: {e}")
         import traceback
-        traceback.print_exc()
+        logger.debug(traceback.format_exc())
         return False
 
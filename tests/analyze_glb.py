@@ -6,72 +6,117 @@ Analyze GLB files to check geometry and textures
 import sys
 import os
 
+import numpy as np
+
 try:
     import trimesh
 except ImportError:
     print("Error: trimesh not installed. Install with: pip install trimesh")
     sys.exit(1)
 
+# Loaded scenes keyed on (path, mtime) so repeated analyses of the same
+# file (e.g. from other scripts importing analyze_glb) skip the reload.
+_scene_cache = {}
+
+
+def load_scene(filepath):
+    """
+    Load a GLB scene through trimesh, memoized per file version.
+
+    process=False skips trimesh's vertex merging and validation passes,
+    which dominate load time on city-scale scenes; the report then also
+    reflects the counts actually stored in the file rather than the
+    post-merge geometry.
+    """
+    key = (os.path.abspath(filepath), os.path.getmtime(filepath))
+    if key not in _scene_cache:
+        _scene_cache[key] = trimesh.load(filepath, process=False)
+    return _scene_cache[key]
+
+
+def check_glb_header(filepath):
+    """
+    Validate the 12-byte GLB header before loading.
+
+    A truncated or corrupt file can declare a bogus total length and
+    make the loader attempt a multi-gigabyte allocation; checking the
+    magic, version and declared length against the real file size up
+    front fails fast instead.
+    """
+    import struct
+
+    file_size = os.path.getsize(filepath)
+    if file_size < 12:
+        print(f"Not a GLB file (only {file_size} bytes): {filepath}")
+        return False
+
+    with open(filepath, 'rb') as f:
+        magic, version, length = struct.unpack('<4sII', f.read(12))
+
+    if magic != b'glTF':
+        print(f"Not a GLB file (bad magic {magic!r}): {filepath}")
+        return False
+    if length != file_size:
+        print(f"Corrupt GLB (header declares {length} bytes, file has {file_size}): {filepath}")
+        return False
+    return True
+
+
 def analyze_glb(filepath):
     """Analyze a GLB file and report findings."""
     if not os.path.exists(filepath):
         print(f"File not found: {filepath}")
         return False
-    
+
+    if not check_glb_header(filepath):
+        return False
+
     print(f"\n{'='*60}")
     print(f"Analyzing: {os.path.basename(filepath)}")
     print(f"{'='*60}")
     
     try:
-        scene = trimesh.load(filepath)
-        
+        scene = load_scene(filepath)
+
         print(f"\nScene Statistics:")
         print(f"  Number of geometries: {len(scene.geometry)}")
-        
-        total_vertices = 0
-        total_faces = 0
-        meshes_with_uv = 0
-        meshes_with_texture = 0
-        meshes_without_texture = 0
-        
-        building_meshes = []
-        terrain_meshes = []
-        road_meshes = []
-        other_meshes = []
-        
+
+        # Single pass collecting per-mesh attributes; the aggregates are
+        # computed from the collected arrays below instead of a bundle of
+        # running counters.
+        rows = []
+        meshes_with_base_color = 0
+
         for name, geom in scene.geometry.items():
-            total_vertices += len(geom.vertices)
-            total_faces += len(geom.faces)
-            
             has_uv = hasattr(geom.visual, 'uv') and geom.visual.uv is not None and len(geom.visual.uv) > 0
             has_texture = hasattr(geom.visual, 'material') and geom.visual.material is not None
-            
-            if has_uv:
-                meshes_with_uv += 1
-            if has_texture:
-                meshes_with_texture += 1
-                if hasattr(geom.visual.material, 'baseColorTexture'):
-                    print(f"  Mesh '{name}': Has texture material with baseColorTexture")
-            else:
-                meshes_without_texture += 1
-            
-            # Categorize meshes by vertex count (rough heuristic)
-            vcount = len(geom.vertices)
-            if vcount > 1000:
-                building_meshes.append((name, vcount, has_uv, has_texture))
-            elif vcount > 100:
-                road_meshes.append((name, vcount, has_uv, has_texture))
-            elif vcount > 10:
-                terrain_meshes.append((name, vcount, has_uv, has_texture))
-            else:
-                other_meshes.append((name, vcount, has_uv, has_texture))
-        
+
+            # Counted rather than printed per mesh: large scenes have
+            # thousands of textured meshes and per-mesh output swamps
+            # the report (and the terminal).
+            if has_texture and hasattr(geom.visual.material, 'baseColorTexture'):
+                meshes_with_base_color += 1
+
+            rows.append((name, len(geom.vertices), len(geom.faces), has_uv, has_texture))
+
+        vcounts = np.array([r[1] for r in rows], dtype=np.int64)
+        fcounts = np.array([r[2] for r in rows], dtype=np.int64)
+        has_uv_arr = np.array([r[3] for r in rows], dtype=bool)
+        has_tex_arr = np.array([r[4] for r in rows], dtype=bool)
+
+        # Categorize meshes by vertex count (rough heuristic)
+        building_meshes = [(r[0], r[1], r[3], r[4]) for r in rows if r[1] > 1000]
+        road_meshes = [(r[0], r[1], r[3], r[4]) for r in rows if 100 < r[1] <= 1000]
+        terrain_meshes = [(r[0], r[1], r[3], r[4]) for r in rows if 10 < r[1] <= 100]
+        other_meshes = [(r[0], r[1], r[3], r[4]) for r in rows if r[1] <= 10]
+
         print(f"\nTotal Statistics:")
-        print(f"  Total vertices: {total_vertices:,}")
-        print(f"  Total faces: {total_faces:,}")
-        print(f"  Meshes with UV coordinates: {meshes_with_uv}")
-        print(f"  Meshes with texture material: {meshes_with_texture}")
-        print(f"  Meshes without texture: {meshes_without_texture}")
+        print(f"  Total vertices: {int(vcounts.sum()):,}")
+        print(f"  Total faces: {int(fcounts.sum()):,}")
+        print(f"  Meshes with UV coordinates: {int(has_uv_arr.sum())}")
+        print(f"  Meshes with texture material: {int(has_tex_arr.sum())}")
+        print(f"  Meshes with baseColorTexture: {meshes_with_base_color}")
+        print(f"  Meshes without texture: {int((~has_tex_arr).sum())}")
         
         print(f"\nMesh Categories:")
         print(f"  Building-like meshes (>1000 vertices): {len(building_meshes)}")
@@ -8,9 +8,12 @@ Usage:
     python generate_showcases.py --list       # List available locations
 """
 
+import json
 import subprocess
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Famous Swiss locations for showcases
@@ -65,19 +68,21 @@ QUICK_RADIUS = 250
 QUICK_RESOLUTION = 20
 
 
-def generate_showcase(location: dict, radius: int, resolution: int, output_dir: str = "results"):
+def generate_showcase(location: dict, radius: int, resolution: int, output_dir: str = "results",
+                      capture_output: bool = False, log=sys.stdout):
     """Generate a single showcase IFC file."""
     name = location["name"]
     address = location["address"]
     output_path = f"{output_dir}/showcase_{name}.ifc"
-    
-    print(f"\n{'='*60}")
-    print(f"  Generating: {name}")
-    print(f"  Address: {address}")
-    print(f"  Radius: {radius}m | Resolution: {resolution}m")
-    print(f"  Output: {output_path}")
-    print(f"{'='*60}\n")
-    
+
+    if not capture_output:
+        print(f"\n{'='*60}", file=log)
+        print(f"  Generating: {name}", file=log)
+        print(f"  Address: {address}", file=log)
+        print(f"  Radius: {radius}m | Resolution: {resolution}m", file=log)
+        print(f"  Output: {output_path}", file=log)
+        print(f"{'='*60}\n", file=log)
+
     cmd = [
         sys.executable, "src/cli.py",
         "--address", address,
@@ -86,18 +91,27 @@ def generate_showcase(location: dict, radius: int, resolution: int, output_dir:
         "--resolution", str(resolution),
         "--output", output_path
     ]
-    
+
+    t0 = time.perf_counter()
     try:
-        result = subprocess.run(cmd, check=True)
-        print(f"\n✅ SUCCESS: {output_path}")
-        return True
+        result = subprocess.run(cmd, check=True, capture_output=capture_output)
+        print(f"\n✅ SUCCESS: {output_path}", file=log)
+        success = True
     except subprocess.CalledProcessError as e:
-        print(f"\n❌ FAILED: {name} (exit code {e.returncode})")
-        return False
+        print(f"\n❌ FAILED: {name} (exit code {e.returncode})", file=log)
+        success = False
     except KeyboardInterrupt:
-        print(f"\n⚠️  INTERRUPTED: {name}")
+        print(f"\n⚠️  INTERRUPTED: {name}", file=log)
         raise
 
+    return {
+        "name": name,
+        "address": address,
+        "output": output_path,
+        "success": success,
+        "elapsed_s": round(time.perf_counter() - t0, 2),
+    }
+
 
 def main():
     import argparse
@@ -115,6 +129,10 @@ def main():
                         help="Generate only specific location(s), comma-separated names")
     parser.add_argument("--output-dir", type=str, default="results",
                         help="Output directory for IFC files (default: results)")
+    parser.add_argument("--parallel", type=int, default=1,
+                        help="Number of showcases to generate concurrently (default: 1)")
+    parser.add_argument("--json", action="store_true",
+                        help="Emit a machine-readable JSON summary instead of the pretty one")
     
     args = parser.parse_args()
     
@@ -148,30 +166,67 @@ def main():
     
     # Create output directory
     os.makedirs(args.output_dir, exist_ok=True)
-    
+
+    # In --json mode stdout must stay a single parseable document, so
+    # progress goes to stderr and child output is always captured
+    log = sys.stderr if args.json else sys.stdout
+    capture = args.json
+
     # Generate showcases
-    print("\n" + "=" * 60)
-    print("  Swiss Site Model - Showcase Generator")
-    print("=" * 60)
-    print(f"\nLocations: {len(locations)}")
-    print(f"Radius: {radius}m")
-    print(f"Resolution: {resolution}m")
-    print(f"Output: {args.output_dir}/")
-    
-    success_count = 0
-    failed = []
-    
+    print("\n" + "=" * 60, file=log)
+    print("  Swiss Site Model - Showcase Generator", file=log)
+    print("=" * 60, file=log)
+    print(f"\nLocations: {len(locations)}", file=log)
+    print(f"Radius: {radius}m", file=log)
+    print(f"Resolution: {resolution}m", file=log)
+    print(f"Output: {args.output_dir}/", file=log)
+
+    records = []
+
     try:
-        for i, location in enumerate(locations, 1):
-            print(f"\n[{i}/{len(locations)}]", end="")
-            if generate_showcase(location, radius, resolution, args.output_dir):
-                success_count += 1
-            else:
-                failed.append(location["name"])
+        if args.parallel > 1 and len(locations) > 1:
+            # Each generation is an independent subprocess that mostly waits
+            # on network I/O, so overlapping them collapses wall time towards
+            # the slowest single showcase. Output is captured per subprocess
+            # to avoid interleaving.
+            with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+                futures = {
+                    executor.submit(
+                        generate_showcase, location, radius, resolution,
+                        args.output_dir, True, log
+                    ): location
+                    for location in locations
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    location = futures[future]
+                    print(f"\n[{i}/{len(locations)}] {location['name']}", end="", file=log)
+                    records.append(future.result())
+        else:
+            for i, location in enumerate(locations, 1):
+                print(f"\n[{i}/{len(locations)}]", end="", file=log)
+                records.append(
+                    generate_showcase(location, radius, resolution, args.output_dir,
+                                      capture, log)
+                )
     except KeyboardInterrupt:
-        print("\n\n⚠️  Generation interrupted by user")
-    
-    # Summary
+        print("\n\n⚠️  Generation interrupted by user", file=log)
+
+    success_count = sum(1 for r in records if r["success"])
+    failed = [r["name"] for r in records if not r["success"]]
+
+    # Summary - single JSON document for CI consumers, pretty otherwise
+    if args.json:
+        json.dump({
+            "radius_m": radius,
+            "resolution_m": resolution,
+            "output_dir": args.output_dir,
+            "successful": success_count,
+            "total": len(locations),
+            "results": records,
+        }, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
     print("\n" + "=" * 60)
     print("  SUMMARY")
     print("=" * 60)
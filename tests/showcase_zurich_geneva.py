@@ -24,7 +24,7 @@ def showcase_city(name, address, output_prefix):
     print(f"Features: ALL (terrain, roads, water, buildings, railways, satellite imagery)")
     print()
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         result = run_combined_terrain_workflow(
@@ -47,7 +47,7 @@ def showcase_city(name, address, output_prefix):
             return_model=False
         )
         
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         
         print("\n" + "=" * 80)
         print(f"SUCCESS: {name} showcase created!")
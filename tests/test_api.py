@@ -116,7 +116,7 @@ def test_job_status(job_id):
         return None
     
     max_wait = 300  # 5 minutes max wait
-    start_time = time.time()
+    start_time = time.perf_counter()
     check_interval = 5  # Check every 5 seconds
     
     try:
@@ -143,14 +143,14 @@ def test_job_status(job_id):
                 print(f"✗ Job failed: {error}")
                 return None
             elif status == "running":
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if elapsed > max_wait:
                     print(f"✗ Job timed out after {max_wait} seconds")
                     return None
                 print(f"  Waiting... (elapsed: {elapsed:.1f}s)")
                 time.sleep(check_interval)
             elif status == "pending":
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if elapsed > max_wait:
                     print(f"✗ Job timed out after {max_wait} seconds")
                     return None
@@ -5,6 +5,7 @@ Test script to generate IFC file with satellite imagery overlay
 Tests the new satellite imagery loader and texture mapping functionality.
 """
 
+import argparse
 import logging
 import sys
 from src.site_model import run_combined_terrain_workflow
@@ -17,24 +18,36 @@ logging.basicConfig(
 
 def main():
     """Generate test IFC with satellite imagery overlay"""
-    
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fast", action="store_true",
+        help="Smoke-test mode: small radius, coarse resolutions"
+    )
+    args = parser.parse_args()
+
     # Use a well-known location (Paradeplatz, Zurich)
     address = "Paradeplatz, 8001 Zürich"
-    
+
+    # Same code paths with ~100x less data for CI smoke runs
+    radius = 100.0 if args.fast else 500.0
+    resolution = 50.0 if args.fast else 10.0
+    imagery_resolution = 5.0 if args.fast else 0.5
+
     print("=" * 80)
     print("Testing Satellite Imagery Overlay")
     print("=" * 80)
     print(f"Location: {address}")
-    print("Radius: 500m")
-    print("Imagery Resolution: 0.5m/pixel")
+    print(f"Radius: {radius:.0f}m{' (fast mode)' if args.fast else ''}")
+    print(f"Imagery Resolution: {imagery_resolution}m/pixel")
     print("Embedded: True")
     print()
-    
+
     try:
         result = run_combined_terrain_workflow(
             address=address,
-            radius=500.0,
-            resolution=10.0,
+            radius=radius,
+            resolution=resolution,
             include_terrain=True,
             include_site_solid=True,
             include_roads=True,
@@ -45,7 +58,7 @@ def main():
             include_bridges=False,
             include_satellite_overlay=True,  # Enable satellite imagery
             embed_imagery=True,  # Embed imagery in IFC
-            imagery_resolution=0.5,  # 0.5m per pixel
+            imagery_resolution=imagery_resolution,
             imagery_year=None,  # Use current imagery
             output_path="test_satellite_imagery.ifc",
             return_model=False
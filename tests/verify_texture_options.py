@@ -5,6 +5,7 @@ Verify the difference between buildings with and without textures
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import trimesh
@@ -12,14 +13,30 @@ except ImportError:
     print("Error: trimesh not available")
     sys.exit(1)
 
+# Parsed scenes keyed on (path, mtime) — the same GLB is often checked
+# several times in one session and re-parsing (texture decode included)
+# dominates the runtime.
+_scene_cache = {}
+
+
+def _load_scene(filename):
+    key = (os.path.abspath(filename), os.path.getmtime(filename))
+    if key not in _scene_cache:
+        # process=False skips vertex merging/validation, which is wasted
+        # work for a UV-presence check. Materials are still parsed because
+        # the analysis inspects geom.visual.
+        _scene_cache[key] = trimesh.load(filename, process=False)
+    return _scene_cache[key]
+
+
 def analyze_glb(filename):
     """Analyze a GLB file and report building texture status"""
     if not os.path.exists(filename):
         print(f"File not found: {filename}")
         return None
-    
+
     try:
-        scene = trimesh.load(filename)
+        scene = _load_scene(filename)
         
         buildings_with_uv = 0
         buildings_without_uv = 0
@@ -73,11 +90,15 @@ def main():
         ("test_buildings_no_textures.glb", "WITHOUT textures"),
         ("test_with_textures.glb", "WITH textures (CLI)"),
     ]
-    
-    for filename, description in files:
+
+    # Parse the three files concurrently (GLB decode releases the GIL in
+    # zlib/PIL), then report in order.
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        results = list(executor.map(analyze_glb, [f for f, _ in files]))
+
+    for (filename, description), result in zip(files, results):
         print(f"\n{description}: {filename}")
         print("-" * 60)
-        result = analyze_glb(filename)
         if result:
             print(f"  Total buildings: {result['total']}")
             print(f"  Buildings with UV/textures: {result['with_uv']}")